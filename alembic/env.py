@@ -1,8 +1,10 @@
 import asyncio
+import threading
+import time
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from app.core.config import settings
@@ -55,10 +57,60 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+# Alembic's migration context is a module-level proxy, so concurrent
+# command.upgrade() calls from multi-worker startup corrupt each other.
+# The threading lock serializes workers within one process; the Postgres
+# advisory lock serializes workers across processes/hosts.
+_MIGRATION_LOCK = threading.Lock()
+
+# Arbitrary but stable key identifying "the Alembic upgrade" lock
+_ADVISORY_LOCK_KEY = 0xA1B2C3D4
+
+# How long a worker waits for another worker's migration before giving up
+_ADVISORY_LOCK_TIMEOUT_SECONDS = 60
+_ADVISORY_LOCK_RETRY_SECONDS = 0.5
+
+
+def _acquire_advisory_lock(connection) -> bool:
+    """Try to take the Postgres advisory migration lock, with retries."""
+    deadline = time.monotonic() + _ADVISORY_LOCK_TIMEOUT_SECONDS
+    while True:
+        acquired = connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"),
+            {"key": _ADVISORY_LOCK_KEY}
+        ).scalar()
+        if acquired:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(_ADVISORY_LOCK_RETRY_SECONDS)
+
+
+def _release_advisory_lock(connection) -> None:
+    """Release the Postgres advisory migration lock."""
+    connection.execute(
+        text("SELECT pg_advisory_unlock(:key)"),
+        {"key": _ADVISORY_LOCK_KEY}
+    )
+
+
 def do_run_migrations(connection):
     context.configure(connection=connection, target_metadata=target_metadata)
-    with context.begin_transaction():
-        context.run_migrations()
+
+    use_advisory_lock = connection.dialect.name == "postgresql"
+    with _MIGRATION_LOCK:
+        if use_advisory_lock:
+            if not _acquire_advisory_lock(connection):
+                raise TimeoutError(
+                    "Timed out waiting for the Alembic advisory lock; "
+                    "another worker's migration appears stuck"
+                )
+        try:
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            if use_advisory_lock:
+                _release_advisory_lock(connection)
 
 
 async def run_async_migrations() -> None:
@@ -19,23 +19,41 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Create the enum type first
-    userrole_enum = sa.Enum('ADMIN', 'MODERATOR', 'USER', name='userrole')
-    userrole_enum.create(op.get_bind(), checkfirst=True)
-
-    # Add column as nullable first
-    op.add_column('users', sa.Column('role', userrole_enum, nullable=True))
-
-    # Set default value for existing users
-    op.execute("UPDATE users SET role = 'USER' WHERE role IS NULL")
-
-    # Now make it non-nullable
+    # Use VARCHAR + CHECK instead of a native PG enum: native enums cost
+    # asyncpg extra pg_type/pg_enum introspection round-trips per connection
+    # and require ALTER TYPE migrations to change values later.
+    op.add_column('users', sa.Column('role', sa.String(length=16), nullable=True))
+
+    # Backfill existing users in batches. A single unbounded UPDATE locks
+    # every row in one transaction and balloons WAL on a large table;
+    # committing per batch keeps lock scope and memory bounded.
+    batch_size = 5000
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(
+                sa.text(
+                    "UPDATE users SET role = 'USER' "
+                    "WHERE id IN ("
+                    "  SELECT id FROM users WHERE role IS NULL "
+                    "  LIMIT :batch FOR UPDATE SKIP LOCKED"
+                    ")"
+                ),
+                {"batch": batch_size}
+            )
+            if result.rowcount == 0:
+                break
+
+    # Constrain to the known roles, then make it non-nullable
+    op.create_check_constraint(
+        'ck_users_role',
+        'users',
+        "role IN ('ADMIN', 'MODERATOR', 'USER')"
+    )
     op.alter_column('users', 'role', nullable=False)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
+    op.drop_constraint('ck_users_role', 'users', type_='check')
     op.drop_column('users', 'role')
-
-    # Drop the enum type
-    sa.Enum(name='userrole').drop(op.get_bind(), checkfirst=True)
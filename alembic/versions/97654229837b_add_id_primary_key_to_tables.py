@@ -17,20 +17,57 @@ down_revision: Union[str, Sequence[str], None] = '554db8f462ac'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+BATCH_SIZE = 5000
+
+
+def _add_id_primary_key(table: str) -> None:
+    """Add an auto-increment id primary key to a table without a long lock.
+
+    ADD COLUMN id SERIAL rewrites the whole table under an ACCESS EXCLUSIVE
+    lock, and ADD PRIMARY KEY builds its unique index under the same lock.
+    Instead: add a plain nullable bigint with a sequence default (metadata-
+    only on PG11+), backfill in committed batches, build the unique index
+    CONCURRENTLY, then promote the existing index to the primary key.
+    """
+    seq = f"{table}_id_seq"
+    op.execute(f"CREATE SEQUENCE {seq}")
+    op.execute(f"ALTER TABLE {table} ADD COLUMN id bigint")
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{seq}')")
+    op.execute(f"ALTER SEQUENCE {seq} OWNED BY {table}.id")
+
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(
+                sa.text(
+                    f"UPDATE {table} SET id = nextval('{seq}') "
+                    f"WHERE uuid IN ("
+                    f"  SELECT uuid FROM {table} WHERE id IS NULL "
+                    f"  LIMIT :batch FOR UPDATE SKIP LOCKED"
+                    f")"
+                ),
+                {"batch": BATCH_SIZE}
+            )
+            if result.rowcount == 0:
+                break
+
+        # Unique index built without blocking reads/writes
+        op.execute(f"CREATE UNIQUE INDEX CONCURRENTLY {table}_pkey_new ON {table} (id)")
+
+    op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET NOT NULL")
+    op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_pkey")
+    op.execute(
+        f"ALTER TABLE {table} "
+        f"ADD CONSTRAINT {table}_pkey PRIMARY KEY USING INDEX {table}_pkey_new"
+    )
+
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Add id column as SERIAL (auto-increment) to books table
-    # Using raw SQL to properly handle existing data
-    op.execute('ALTER TABLE books ADD COLUMN id SERIAL')
-    op.execute('ALTER TABLE books DROP CONSTRAINT IF EXISTS books_pkey')
-    op.execute('ALTER TABLE books ADD PRIMARY KEY (id)')
+    _add_id_primary_key('books')
     op.create_unique_constraint('books_uuid_key', 'books', ['uuid'])
 
-    # Add id column as SERIAL (auto-increment) to users table
-    op.execute('ALTER TABLE users ADD COLUMN id SERIAL')
-    op.execute('ALTER TABLE users DROP CONSTRAINT IF EXISTS users_pkey')
-    op.execute('ALTER TABLE users ADD PRIMARY KEY (id)')
+    _add_id_primary_key('users')
     op.create_unique_constraint('users_uuid_key', 'users', ['uuid'])
 
 
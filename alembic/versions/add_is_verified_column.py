@@ -12,17 +12,41 @@ from alembic import op
 
 # revision identifiers, used by Alembic.
 revision: str = 'add_is_verified_001'
-down_revision: Union[str, Sequence[str], None] = 'create_reviews_001'
+down_revision: Union[str, Sequence[str], None] = 'create_reviews_002'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Add is_verified column to users table."""
-    op.add_column(
-        'users',
-        sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false')
-    )
+    """Add is_verified column to users table.
+
+    ADD COLUMN ... NOT NULL DEFAULT rewrites the whole table under an
+    ACCESS EXCLUSIVE lock on PostgreSQL before 11. Add the column
+    nullable first (metadata-only everywhere), backfill in committed
+    batches, then attach the default and NOT NULL so the lock windows
+    stay short on every supported PG version.
+    """
+    op.add_column('users', sa.Column('is_verified', sa.Boolean(), nullable=True))
+
+    batch_size = 5000
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(
+                sa.text(
+                    "UPDATE users SET is_verified = false "
+                    "WHERE id IN ("
+                    "  SELECT id FROM users WHERE is_verified IS NULL "
+                    "  LIMIT :batch FOR UPDATE SKIP LOCKED"
+                    ")"
+                ),
+                {"batch": batch_size}
+            )
+            if result.rowcount == 0:
+                break
+
+    op.alter_column('users', 'is_verified', server_default='false')
+    op.alter_column('users', 'is_verified', nullable=False)
 
 
 def downgrade() -> None:
@@ -0,0 +1,43 @@
+"""add reviews (book_id, rating) index concurrently
+
+Revision ID: reviews_book_rating_001
+Revises: server_default_ts_001
+Create Date: 2026-09-01 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'reviews_book_rating_001'
+down_revision: Union[str, Sequence[str], None] = 'server_default_ts_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the (book_id, rating) index without locking the table.
+
+    get_book_average_rating aggregates ratings per book; with both
+    columns in the index Postgres can answer it with an index-only scan
+    instead of touching the heap. Built CONCURRENTLY (in an autocommit
+    block) like the other review indexes so deploys don't block writes.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reviews_book_rating',
+            'reviews',
+            ['book_id', 'rating'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the (book_id, rating) index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_reviews_book_rating',
+            table_name='reviews',
+            postgresql_concurrently=True
+        )
@@ -35,10 +35,20 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint('rating >= 1 AND rating <= 5', name='rating_range')
     )
-    op.create_index('ix_reviews_uuid', 'reviews', ['uuid'], unique=True)
+    # Indexes for the dominant query shapes: "reviews for book X newest
+    # first", "user X's reviews", and the one-review-per-user-per-book
+    # existence check. Built here while the table is empty so no later
+    # migration has to rebuild them on a populated table.
+    op.create_index('ix_reviews_book_created', 'reviews', ['book_id', sa.text('created_at DESC')])
+    op.create_index('ix_reviews_user', 'reviews', ['user_id'])
+    op.create_unique_constraint('uq_reviews_user_book', 'reviews', ['user_id', 'book_id'])
+    # ix_reviews_uuid is built CONCURRENTLY in the follow-up revision
+    # (create_reviews_002) so the index build does not lock the table.
 
 
 def downgrade() -> None:
     """Drop reviews table."""
-    op.drop_index('ix_reviews_uuid', table_name='reviews')
+    op.drop_constraint('uq_reviews_user_book', 'reviews', type_='unique')
+    op.drop_index('ix_reviews_user', table_name='reviews')
+    op.drop_index('ix_reviews_book_created', table_name='reviews')
     op.drop_table('reviews')
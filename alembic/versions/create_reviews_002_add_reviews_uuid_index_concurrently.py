@@ -0,0 +1,44 @@
+"""add_reviews_uuid_index_concurrently
+
+Revision ID: create_reviews_002
+Revises: create_reviews_001
+Create Date: 2026-02-23 21:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'create_reviews_002'
+down_revision: Union[str, Sequence[str], None] = 'create_reviews_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the reviews uuid index without locking the table.
+
+    A plain CREATE INDEX holds an ACCESS EXCLUSIVE lock on reviews for the
+    duration of the build, blocking all reads and writes during deploy.
+    CREATE INDEX CONCURRENTLY only takes a SHARE UPDATE EXCLUSIVE lock, but
+    cannot run inside a transaction, so it runs in an autocommit block.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reviews_uuid',
+            'reviews',
+            ['uuid'],
+            unique=True,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the reviews uuid index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_reviews_uuid',
+            table_name='reviews',
+            postgresql_concurrently=True
+        )
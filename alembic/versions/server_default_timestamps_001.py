@@ -0,0 +1,39 @@
+"""move created_at/updated_at defaults to the database
+
+Revision ID: server_default_ts_001
+Revises: add_is_verified_001
+Create Date: 2026-09-01 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'server_default_ts_001'
+down_revision: Union[str, Sequence[str], None] = 'add_is_verified_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('users', 'books', 'reviews')
+
+
+def upgrade() -> None:
+    """Attach now() server defaults to the timestamp columns.
+
+    The ORM previously filled these with Python-side datetime.now();
+    defaults move to the database so inserts outside the ORM get
+    timestamps too. ALTER ... SET DEFAULT is metadata-only, so this is
+    safe on live tables.
+    """
+    for table in _TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'))
+        op.alter_column(table, 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Drop the server defaults (the ORM default takes over again)."""
+    for table in _TABLES:
+        op.alter_column(table, 'created_at', server_default=None)
+        op.alter_column(table, 'updated_at', server_default=None)
@@ -17,6 +17,7 @@ from app.schemas.auth import (
     ResetPasswordRequest
 )
 from app.schemas.user import ShowUser
+from app.services import get_auth_service
 from app.services.auth_services import AuthService
 
 auth_router = APIRouter(
@@ -24,8 +25,6 @@ auth_router = APIRouter(
     tags=["Authentication"],
 )
 
-auth_service = AuthService()
-
 
 @auth_router.post(
     "/login",
@@ -41,7 +40,8 @@ auth_service = AuthService()
 )
 async def login(
         form_data: OAuth2PasswordRequestForm = Depends(),
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> Token:
     """Login with email (as username) and password."""
     return await auth_service.login(
@@ -61,7 +61,8 @@ async def login(
 )
 async def register(
         user_data: RegisterRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> ShowUser:
     """Register a new user."""
     return await auth_service.register(user_data, session)
@@ -81,7 +82,8 @@ async def register(
 )
 async def refresh_token(
         token_data: RefreshTokenRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> Token:
     """Refresh access token using refresh token."""
     return await auth_service.refresh_access_token(token_data.refresh_token, session)
@@ -101,7 +103,8 @@ async def refresh_token(
 )
 async def logout(
         token: str = Depends(oauth2_scheme),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """Logout by revoking the current token."""
     result = await auth_service.logout(token)
@@ -121,7 +124,8 @@ async def logout(
     }
 )
 async def logout_all_devices(
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """Logout from all devices by invalidating all tokens."""
     result = await auth_service.logout_all_devices(str(current_user.uuid))
@@ -146,7 +150,8 @@ async def logout_all_devices(
 )
 async def verify_email_via_link(
         token: str,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """
     Verify email address by clicking the link received via email.
@@ -172,7 +177,8 @@ async def verify_email_via_link(
 )
 async def verify_email(
         request: VerifyEmailRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """
     Verify email address with the token received via email.
@@ -198,7 +204,8 @@ async def verify_email(
 )
 async def resend_verification_email(
         request: ResendVerificationRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """
     Resend the verification email to the user.
@@ -227,7 +234,8 @@ async def resend_verification_email(
 )
 async def forgot_password(
         request: ForgotPasswordRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """
     Request a password reset email.
@@ -253,7 +261,8 @@ async def forgot_password(
 )
 async def reset_password(
         request: ResetPasswordRequest,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        auth_service: AuthService = Depends(get_auth_service)
 ) -> MessageResponse:
     """
     Reset password using the token received via email.
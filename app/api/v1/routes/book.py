@@ -1,34 +1,91 @@
 import uuid
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, status, Depends
+import orjson
+from fastapi import APIRouter, status, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_cached_response, invalidate_cached_response, set_cached_response
 from app.core.database import get_session
+from app.core.http_cache import conditional_response
+from app.core.params import UUIDStr, parse_uuid
 from app.core.exceptions import BookNotFoundException
 from app.core.responses import PUBLIC_RESPONSES, AUTH_RESPONSES, CREATE_RESPONSES
-from app.core.security import get_current_active_user
+from app.core.security import get_auth_context
+from app.core.user_cache import user_me_cache_key
 from app.models.user import User
 from app.schemas.book import BookCreate, BookOut, BookUpdate
+from app.services import get_book_service
 from app.services.book_service import BookService
 
-book_router = APIRouter(tags=["Books"], prefix="/books")
+book_router = APIRouter(
+    tags=["Books"],
+    prefix="/books",
+    default_response_class=ORJSONResponse,
+)
+
+# Cache keys/TTLs for the public read endpoints
+BOOK_LIST_CACHE_KEY = "books:list"
+BOOK_LIST_CACHE_TTL = 30
+BOOK_CACHE_TTL = 60
+
+# Keyset pagination bounds for the list endpoint
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+# Lets reverse proxies/CDNs absorb repeat reads of the public list;
+# matches the Redis TTL so both layers expire together.
+LIST_CACHE_CONTROL = "public, max-age=30"
 
-book_service = BookService()
+# Compiled once: TypeAdapter validates and serializes the whole list in
+# pydantic-core (Rust), skipping FastAPI's per-request response-model
+# machinery and the per-item Python loop.
+_BOOKS_ADAPTER = TypeAdapter(List[BookOut])
+
+
+def _book_cache_key(book_uuid) -> str:
+    return f"books:{book_uuid}"
 
 
 @book_router.get(
     "/",
     response_model=List[BookOut],
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
     summary="Get all books",
-    description="Retrieve all books in the system.",
+    description="Retrieve books newest-first. Pass the last book's UUID as "
+                "`after` to fetch the next page.",
     responses={500: PUBLIC_RESPONSES[500]}
 )
-async def get_books(session: AsyncSession = Depends(get_session)) -> List[BookOut]:
+async def get_books(
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[uuid.UUID] = Query(None, description="UUID of the last book on the previous page"),
+        session: AsyncSession = Depends(get_session),
+        book_service: BookService = Depends(get_book_service)
+) -> ORJSONResponse:
     """Get all books"""
-    books = await book_service.get_all_books(session)
-    return books
+    # Only the default first page is cached; deeper pages are rare.
+    is_default_page = after is None and limit == DEFAULT_PAGE_LIMIT
+    if is_default_page:
+        cached = await get_cached_response(BOOK_LIST_CACHE_KEY)
+        if cached is not None:
+            return Response(
+                content=cached,
+                media_type="application/json",
+                headers={"Cache-Control": LIST_CACHE_CONTROL}
+            )
+
+    books = await book_service.get_all_books(session, limit=limit, after=after)
+    body = _BOOKS_ADAPTER.dump_json(_BOOKS_ADAPTER.validate_python(books))
+    if is_default_page:
+        await set_cached_response(BOOK_LIST_CACHE_KEY, body, BOOK_LIST_CACHE_TTL)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": LIST_CACHE_CONTROL}
+    )
 
 
 @book_router.get(
@@ -40,10 +97,11 @@ async def get_books(session: AsyncSession = Depends(get_session)) -> List[BookOu
     responses=AUTH_RESPONSES
 )
 async def get_my_books(
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        book_service: BookService = Depends(get_book_service)
 ) -> List[BookOut]:
     """Get all books owned by the current user"""
+    session, current_user = ctx
     books = await book_service.get_user_books(current_user.id, session)
     return books
 
@@ -56,12 +114,26 @@ async def get_my_books(
     description="Get a single book by its UUID.",
     responses=PUBLIC_RESPONSES
 )
-async def get_book(book_uuid: uuid.UUID, session: AsyncSession = Depends(get_session)) -> BookOut:
+async def get_book(
+        request: Request,
+        book_uuid: UUIDStr,
+        session: AsyncSession = Depends(get_session),
+        book_service: BookService = Depends(get_book_service)
+):
     """Get a single book by UUID"""
+    book_uuid = parse_uuid(book_uuid)
+    cache_key = _book_cache_key(book_uuid)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+
     book = await book_service.get_book(book_uuid, session)
     if not book:
         raise BookNotFoundException(book_uuid)
-    return book
+    payload = BookOut.model_validate(book).model_dump(mode="json")
+    body = orjson.dumps(payload)
+    await set_cached_response(cache_key, body, BOOK_CACHE_TTL)
+    return conditional_response(request, body, updated_at=book.updated_at)
 
 
 @book_router.post(
@@ -74,11 +146,14 @@ async def get_book(book_uuid: uuid.UUID, session: AsyncSession = Depends(get_ses
 )
 async def create_book(
         book: BookCreate,
-        session: AsyncSession = Depends(get_session),
-        current_user: Optional[User] = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        book_service: BookService = Depends(get_book_service)
 ) -> BookOut:
     """Create a new book (associated with authenticated user)"""
+    session, current_user = ctx
     new_book = await book_service.create_book(book, session, user_id=current_user.id if current_user else None)
+    # /me embeds the owner's books, so its cache entry is stale now too.
+    await invalidate_cached_response(BOOK_LIST_CACHE_KEY, user_me_cache_key(current_user.uuid))
     return new_book
 
 
@@ -93,11 +168,17 @@ async def create_book(
 async def update_book(
         book_uuid: uuid.UUID,
         book_update_data: BookUpdate,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        book_service: BookService = Depends(get_book_service)
 ) -> BookOut:
     """Update a book by UUID (only owner can update)"""
+    session, current_user = ctx
     updated_book = await book_service.update_book(book_uuid, book_update_data, session, current_user)
+    await invalidate_cached_response(
+        BOOK_LIST_CACHE_KEY,
+        _book_cache_key(book_uuid),
+        user_me_cache_key(current_user.uuid)
+    )
     return updated_book
 
 
@@ -110,8 +191,14 @@ async def update_book(
 )
 async def delete_book(
         book_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        book_service: BookService = Depends(get_book_service)
 ) -> None:
     """Delete a book by UUID (only owner can delete)"""
+    session, current_user = ctx
     await book_service.delete_book(book_uuid, session, current_user)
+    await invalidate_cached_response(
+        BOOK_LIST_CACHE_KEY,
+        _book_cache_key(book_uuid),
+        user_me_cache_key(current_user.uuid)
+    )
@@ -17,6 +17,7 @@ from app.core.security import create_access_token, create_refresh_token
 from app.models.user import User, UserRole
 from app.schemas.auth import Token
 from app.services.oauth_service import oauth_service
+from app.services import get_user_service
 from app.services.user_services import UserService
 
 logger = logging.getLogger("bookapi.oauth")
@@ -26,7 +27,6 @@ oauth_router = APIRouter(
     tags=["OAuth2 Social Login"],
 )
 
-user_service = UserService()
 
 
 @oauth_router.get(
@@ -76,7 +76,8 @@ async def oauth_callback(
         provider: str,
         code: str = Query(..., description="Authorization code from provider"),
         state: Optional[str] = Query(default=None, description="State parameter for CSRF protection"),
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
 ):
     """
     Handle the OAuth2 callback from the provider.
@@ -1,13 +1,20 @@
+import asyncio
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, status
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import TypeAdapter
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_cached_response, invalidate_cached_response, set_cached_response
 from app.core.database import get_session
+from app.core.http_cache import conditional_response
+from app.core.params import UUIDStr, parse_uuid
 from app.core.exceptions import ReviewNotFoundException
 from app.core.responses import PUBLIC_RESPONSES, AUTH_RESPONSES, CREATE_RESPONSES
-from app.core.security import get_current_active_user
+from app.core.security import get_auth_context
 from app.models.user import User
 from app.schemas.auth import MessageResponse
 from app.schemas.review import (
@@ -17,29 +24,75 @@ from app.schemas.review import (
     ReviewWithBook,
     ReviewFull
 )
+from app.services import get_review_service
 from app.services.review_service import ReviewService
 
 review_router = APIRouter(
     prefix="/reviews",
     tags=["Reviews"],
+    default_response_class=ORJSONResponse,
 )
 
-review_service = ReviewService()
+# Cache keys/TTLs for the public per-book read endpoints. Reviews churn
+# more than books, so the TTLs are short; writes invalidate eagerly.
+BOOK_REVIEWS_CACHE_TTL = 30
+BOOK_STATS_CACHE_TTL = 15
+
+# Keyset pagination bounds for the list endpoints
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+# Lets reverse proxies/CDNs absorb repeat reads of the public list.
+LIST_CACHE_CONTROL = "public, max-age=30"
+
+# Compiled once: TypeAdapter validates and serializes the whole list in
+# pydantic-core (Rust), skipping the per-item Python loop.
+_BOOK_REVIEWS_ADAPTER = TypeAdapter(List[ReviewWithReviewer])
+
+
+def _book_reviews_cache_key(book_uuid) -> str:
+    return f"reviews:book:{book_uuid}"
+
+
+def _book_stats_cache_key(book_uuid) -> str:
+    return f"reviews:book:{book_uuid}:stats"
+
 
 
 @review_router.get(
     "/",
-    response_model=List[ReviewFull],
     status_code=status.HTTP_200_OK,
     summary="Get all reviews",
     description="Retrieve all reviews with reviewer and book information.",
-    responses={500: PUBLIC_RESPONSES[500]}
+    # response_model would buffer the stream; document the shape instead.
+    responses={200: {"model": List[ReviewFull]}, 500: PUBLIC_RESPONSES[500]}
 )
 async def get_all_reviews(
-        session: AsyncSession = Depends(get_session)
-) -> List[ReviewFull]:
-    """Get all reviews."""
-    return await review_service.get_all_reviews(session)
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[uuid.UUID] = Query(None, description="UUID of the last review on the previous page"),
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
+) -> StreamingResponse:
+    """Stream all reviews as an incrementally encoded JSON array."""
+    async def render():
+        yield b"["
+        count = 0
+        async for review in review_service.stream_all_reviews(session, limit=limit, after=after):
+            if count:
+                yield b","
+            yield orjson.dumps(ReviewFull.model_validate(review).model_dump(mode="json"))
+            count += 1
+            # Yield control periodically so a huge result set cannot
+            # monopolize the event loop during encoding.
+            if count % 100 == 0:
+                await asyncio.sleep(0)
+        yield b"]"
+
+    return StreamingResponse(
+        render(),
+        media_type="application/json",
+        headers={"Cache-Control": LIST_CACHE_CONTROL}
+    )
 
 
 @review_router.get(
@@ -51,10 +104,11 @@ async def get_all_reviews(
     responses=AUTH_RESPONSES
 )
 async def get_my_reviews(
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> List[ReviewWithBook]:
     """Get current user's reviews."""
+    session, current_user = ctx
     return await review_service.get_my_reviews(current_user, session)
 
 
@@ -68,10 +122,25 @@ async def get_my_reviews(
 )
 async def get_reviews_by_book(
         book_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
-) -> List[ReviewWithReviewer]:
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[uuid.UUID] = Query(None, description="UUID of the last review on the previous page"),
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
+):
     """Get all reviews for a book."""
-    return await review_service.get_reviews_by_book(book_uuid, session)
+    # Only the default first page is cached; deeper pages are rare.
+    is_default_page = after is None and limit == DEFAULT_PAGE_LIMIT
+    cache_key = _book_reviews_cache_key(book_uuid)
+    if is_default_page:
+        cached = await get_cached_response(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    reviews = await review_service.get_reviews_by_book(book_uuid, session, limit=limit, after=after)
+    body = _BOOK_REVIEWS_ADAPTER.dump_json(_BOOK_REVIEWS_ADAPTER.validate_python(reviews))
+    if is_default_page:
+        await set_cached_response(cache_key, body, BOOK_REVIEWS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @review_router.get(
@@ -83,10 +152,19 @@ async def get_reviews_by_book(
 )
 async def get_book_rating_stats(
         book_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
-) -> dict:
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
+):
     """Get average rating for a book."""
-    return await review_service.get_book_average_rating(book_uuid, session)
+    cache_key = _book_stats_cache_key(book_uuid)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    stats = await review_service.get_book_average_rating(book_uuid, session)
+    body = orjson.dumps(stats)
+    await set_cached_response(cache_key, body, BOOK_STATS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @review_router.get(
@@ -99,10 +177,13 @@ async def get_book_rating_stats(
 )
 async def get_reviews_by_user(
         user_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[uuid.UUID] = Query(None, description="UUID of the last review on the previous page"),
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> List[ReviewWithBook]:
     """Get all reviews by a user."""
-    return await review_service.get_reviews_by_user(user_uuid, session)
+    return await review_service.get_reviews_by_user(user_uuid, session, limit=limit, after=after)
 
 
 @review_router.get(
@@ -114,14 +195,17 @@ async def get_reviews_by_user(
     responses=PUBLIC_RESPONSES
 )
 async def get_review(
-        review_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
-) -> ReviewFull:
+        request: Request,
+        review_uuid: UUIDStr,
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
+):
     """Get a review by UUID."""
-    review = await review_service.get_review_by_uuid(review_uuid, session)
+    review = await review_service.get_review_by_uuid(parse_uuid(review_uuid), session)
     if not review:
         raise ReviewNotFoundException(review_uuid)
-    return review
+    body = orjson.dumps(ReviewFull.model_validate(review).model_dump(mode="json"))
+    return conditional_response(request, body, updated_at=review.updated_at)
 
 
 @review_router.post(
@@ -135,11 +219,17 @@ async def get_review(
 async def create_review(
         book_uuid: uuid.UUID,
         review_data: ReviewCreate,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> ReviewFull:
     """Create a new review for a book."""
-    return await review_service.create_review(book_uuid, review_data, current_user, session)
+    session, current_user = ctx
+    review = await review_service.create_review(book_uuid, review_data, current_user, session)
+    await invalidate_cached_response(
+        _book_reviews_cache_key(book_uuid),
+        _book_stats_cache_key(book_uuid)
+    )
+    return review
 
 
 @review_router.patch(
@@ -153,11 +243,17 @@ async def create_review(
 async def update_review(
         review_uuid: uuid.UUID,
         review_data: ReviewUpdate,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> ReviewFull:
     """Update a review."""
-    return await review_service.update_review(review_uuid, review_data, current_user, session)
+    session, current_user = ctx
+    review = await review_service.update_review(review_uuid, review_data, current_user, session)
+    await invalidate_cached_response(
+        _book_reviews_cache_key(review.book.uuid),
+        _book_stats_cache_key(review.book.uuid)
+    )
+    return review
 
 
 @review_router.delete(
@@ -170,9 +266,18 @@ async def update_review(
 )
 async def delete_review(
         review_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> MessageResponse:
     """Delete a review."""
+    session, current_user = ctx
+    # Look the review up first so the per-book caches can be invalidated
+    # after it is gone.
+    review = await review_service.get_review_by_uuid(review_uuid, session)
     result = await review_service.delete_review(review_uuid, current_user, session)
+    if review:
+        await invalidate_cached_response(
+            _book_reviews_cache_key(review.book.uuid),
+            _book_stats_cache_key(review.book.uuid)
+        )
     return MessageResponse(**result)
@@ -1,29 +1,80 @@
 import uuid
-from typing import List
+from typing import List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, status
+from pydantic import EmailStr, TypeAdapter
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import get_cached_response, set_cached_response
 from app.core.database import get_session
 from app.core.exceptions import UserNotFoundException
+from app.core.http_cache import conditional_response
+from app.core.params import UUIDStr, parse_uuid
 from app.core.responses import PUBLIC_RESPONSES, AUTH_RESPONSES
-from app.core.security import get_current_active_user
+from app.core.security import get_auth_context
+from app.core.user_cache import (
+    USER_CACHE_TTL,
+    invalidate_user_cache,
+    user_email_cache_key,
+    user_me_cache_key,
+    user_uuid_cache_key
+)
 from app.models.user import User
 from app.schemas.auth import MessageResponse
 from app.schemas.user import (
+    BookInUser,
     ShowUser,
+    UserRole,
     UserWithBooks,
     UserUpdate,
     PasswordChange
 )
+from app.services import get_user_service
 from app.services.user_services import UserService
 
 user_router = APIRouter(
     prefix="/users",
     tags=["Users"],
+    default_response_class=ORJSONResponse,
 )
 
-user_service = UserService()
+# Keyset pagination bounds for the list endpoint
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 200
+
+# Compiled once: TypeAdapter serializes the whole list in pydantic-core
+# (Rust), skipping the per-item response-model loop.
+_USERS_ADAPTER = TypeAdapter(List[ShowUser])
+
+# Field-name tuples snapshotted once for the model_construct fast path
+_SHOW_USER_FIELDS = tuple(ShowUser.model_fields)
+_BOOK_IN_USER_FIELDS = tuple(BookInUser.model_fields)
+
+
+def _show_user(user: User) -> ShowUser:
+    """Build ShowUser from a trusted ORM row without re-validation.
+
+    The row came straight from the database, so the per-field validator
+    chain that model_validate runs is pure overhead; model_construct
+    just assigns. The role is re-wrapped in the schema enum so the
+    serializer sees the type it expects.
+    """
+    data = {name: getattr(user, name) for name in _SHOW_USER_FIELDS}
+    data["role"] = UserRole(data["role"].value)
+    return ShowUser.model_construct(**data)
+
+
+def _user_with_books(user: User, books) -> UserWithBooks:
+    """Build UserWithBooks from trusted ORM rows (see _show_user)."""
+    data = {name: getattr(user, name) for name in _SHOW_USER_FIELDS}
+    data["role"] = UserRole(data["role"].value)
+    data["books"] = [
+        BookInUser.model_construct(**{name: getattr(book, name) for name in _BOOK_IN_USER_FIELDS})
+        for book in books
+    ]
+    return UserWithBooks.model_construct(**data)
+
 
 
 @user_router.get(
@@ -35,12 +86,23 @@ user_service = UserService()
     responses=AUTH_RESPONSES
 )
 async def get_me(
-        current_user: User = Depends(get_current_active_user),
-        session: AsyncSession = Depends(get_session)
-) -> UserWithBooks:
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        user_service: UserService = Depends(get_user_service)
+):
     """Get current authenticated user."""
-    user = await user_service.get_user_by_uuid(current_user.uuid, session)
-    return user
+    session, current_user = ctx
+    cache_key = user_me_cache_key(current_user.uuid)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Auth already fetched the user row; only the books are missing.
+    books = await user_service.get_books_for_user(current_user.id, session)
+    # model_dump_json serializes in one pydantic-core pass instead of
+    # building an intermediate dict for orjson to walk again.
+    body = _user_with_books(current_user, books).model_dump_json().encode()
+    await set_cached_response(cache_key, body, USER_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @user_router.post(
@@ -53,10 +115,11 @@ async def get_me(
 )
 async def change_password(
         password_data: PasswordChange,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        user_service: UserService = Depends(get_user_service)
 ) -> MessageResponse:
     """Change current user's password."""
+    session, current_user = ctx
     result = await user_service.change_password(
         user_uuid=current_user.uuid,
         current_password=password_data.current_password,
@@ -64,6 +127,7 @@ async def change_password(
         session=session,
         current_user=current_user
     )
+    await invalidate_user_cache(current_user.uuid, current_user.email)
     return MessageResponse(**result)
 
 
@@ -72,15 +136,20 @@ async def change_password(
     response_model=List[ShowUser],
     status_code=status.HTTP_200_OK,
     summary="Get all users",
-    description="Retrieve a list of all registered users.",
+    description="Retrieve registered users newest-first. Pass the last "
+                "user's UUID as `after` to fetch the next page.",
     responses={500: PUBLIC_RESPONSES[500]}
 )
 async def get_all_users(
-        session: AsyncSession = Depends(get_session)
-) -> List[ShowUser]:
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT),
+        after: Optional[uuid.UUID] = Query(None, description="UUID of the last user on the previous page"),
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
+):
     """Get all users."""
-    users = await user_service.get_all_users(session)
-    return users
+    users = await user_service.get_all_users(session, limit=limit, after=after)
+    body = _USERS_ADAPTER.dump_json([_show_user(user) for user in users])
+    return Response(content=body, media_type="application/json")
 
 
 @user_router.get(
@@ -92,14 +161,22 @@ async def get_all_users(
     responses=PUBLIC_RESPONSES
 )
 async def get_user_by_email(
-        email: str,
-        session: AsyncSession = Depends(get_session)
-) -> ShowUser:
+        email: EmailStr,
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
+):
     """Get a user by email."""
+    cache_key = user_email_cache_key(email)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     user = await user_service.get_user_by_email(email, session)
     if not user:
         raise UserNotFoundException(email)
-    return user
+    body = _show_user(user).model_dump_json().encode()
+    await set_cached_response(cache_key, body, USER_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
 @user_router.get(
@@ -111,14 +188,26 @@ async def get_user_by_email(
     responses=PUBLIC_RESPONSES
 )
 async def get_user_by_uuid(
-        user_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
-) -> UserWithBooks:
+        request: Request,
+        user_uuid: UUIDStr,
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
+):
     """Get a user by UUID."""
+    # Parse before keying: the path regex accepts uppercase hex, and the
+    # invalidation paths delete the canonical lowercase key only.
+    user_uuid = parse_uuid(user_uuid)
+    cache_key = user_uuid_cache_key(user_uuid)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return conditional_response(request, cached)
+
     user = await user_service.get_user_by_uuid(user_uuid, session)
     if not user:
         raise UserNotFoundException(user_uuid)
-    return user
+    body = _user_with_books(user, user.books).model_dump_json().encode()
+    await set_cached_response(cache_key, body, USER_CACHE_TTL)
+    return conditional_response(request, body, updated_at=user.updated_at)
 
 
 @user_router.patch(
@@ -132,13 +221,19 @@ async def get_user_by_uuid(
 async def update_user(
         user_uuid: uuid.UUID,
         update_data: UserUpdate,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Update a user."""
+    session, current_user = ctx
+    # Capture the pre-update email so a changed address does not leave a
+    # stale entry behind.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
+    old_email = target.email if target else None
     updated_user = await user_service.update_user(
         user_uuid, update_data, session, current_user
     )
+    await invalidate_user_cache(user_uuid, old_email, updated_user.email)
     return updated_user
 
 
@@ -152,9 +247,14 @@ async def update_user(
 )
 async def delete_user(
         user_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        ctx: Tuple[AsyncSession, User] = Depends(get_auth_context),
+        user_service: UserService = Depends(get_user_service)
 ) -> MessageResponse:
     """Delete a user."""
+    session, current_user = ctx
+    # Look the user up first so their cache entries can be dropped after
+    # the row is gone.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
     result = await user_service.delete_user(user_uuid, session, current_user)
+    await invalidate_user_cache(user_uuid, target.email if target else None)
     return MessageResponse(**result)
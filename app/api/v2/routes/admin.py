@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_session
 from app.core.responses import ADMIN_RESPONSES
 from app.core.security import get_admin_user
+from app.core.user_cache import invalidate_user_cache
 from app.models.user import User, UserRole
 from app.schemas.auth import MessageResponse
 from app.schemas.user import (
@@ -18,14 +19,16 @@ from app.schemas.user import (
     UserUpdateAdmin,
     UserCreateAdmin
 )
+from app.services import get_user_service
 from app.services.user_services import UserService
 
 admin_router = APIRouter(
     prefix="/admin",
     tags=["Admin"],
+    # Kept out of the public OpenAPI document, matching the v1 router.
+    include_in_schema=False,
 )
 
-user_service = UserService()
 
 
 @admin_router.post(
@@ -39,7 +42,8 @@ user_service = UserService()
 async def admin_create_user(
         user_data: UserCreateAdmin,
         session: AsyncSession = Depends(get_session),
-        admin_user: User = Depends(get_admin_user)
+        admin_user: User = Depends(get_admin_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Admin endpoint to create a user with any role."""
     new_user = await user_service.admin_create_user(user_data, session)
@@ -58,10 +62,16 @@ async def admin_update_user(
         user_uuid: uuid.UUID,
         update_data: UserUpdateAdmin,
         session: AsyncSession = Depends(get_session),
-        admin_user: User = Depends(get_admin_user)
+        admin_user: User = Depends(get_admin_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Admin endpoint to update any user including role."""
+    # Capture the pre-update email so a changed address does not leave a
+    # stale entry behind.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
+    old_email = target.email if target else None
     updated_user = await user_service.admin_update_user(user_uuid, update_data, session)
+    await invalidate_user_cache(user_uuid, old_email, updated_user.email)
     return updated_user
 
 
@@ -76,10 +86,15 @@ async def admin_update_user(
 async def admin_delete_user(
         user_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
-        admin_user: User = Depends(get_admin_user)
+        admin_user: User = Depends(get_admin_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> MessageResponse:
     """Admin endpoint to delete any user."""
+    # Look the user up first so their cache entries can be dropped after
+    # the row is gone.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
     result = await user_service.admin_delete_user(user_uuid, session)
+    await invalidate_user_cache(user_uuid, target.email if target else None)
     return MessageResponse(**result)
 
 
@@ -95,10 +110,12 @@ async def admin_change_user_role(
         user_uuid: uuid.UUID,
         new_role: UserRole,
         session: AsyncSession = Depends(get_session),
-        admin_user: User = Depends(get_admin_user)
+        admin_user: User = Depends(get_admin_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Admin endpoint to change a user's role."""
     updated_user = await user_service.change_user_role(user_uuid, new_role, session)
+    await invalidate_user_cache(user_uuid, updated_user.email)
     return updated_user
 
 
@@ -114,8 +131,10 @@ async def admin_toggle_user_active(
         user_uuid: uuid.UUID,
         is_active: bool,
         session: AsyncSession = Depends(get_session),
-        admin_user: User = Depends(get_admin_user)
+        admin_user: User = Depends(get_admin_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Admin endpoint to activate/deactivate a user."""
     updated_user = await user_service.toggle_user_active(user_uuid, is_active, session)
+    await invalidate_user_cache(user_uuid, updated_user.email)
     return updated_user
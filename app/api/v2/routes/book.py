@@ -20,11 +20,11 @@ from app.core.security import get_current_active_user
 from app.models.user import User
 from app.schemas.book import BookCreate, BookOut, BookUpdate
 from app.schemas.pagination import PaginatedResponse
+from app.services import get_book_service
 from app.services.book_service import BookService
 
 book_router = APIRouter(tags=["Books"], prefix="/books")
 
-book_service = BookService()
 
 
 @book_router.get(
@@ -41,7 +41,8 @@ async def get_books(
         page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
         search: Optional[str] = Query(default=None, description="Search in title and author"),
         sort_by: Optional[str] = Query(default="created_at", description="Sort by field"),
-        sort_order: str = Query(default="desc", pattern="^(asc|desc)$", description="Sort direction")
+        sort_order: str = Query(default="desc", pattern="^(asc|desc)$", description="Sort direction"),
+        book_service: BookService = Depends(get_book_service)
 ) -> PaginatedResponse[BookOut]:
     """Get all books with pagination"""
     books, total = await book_service.get_all_books_paginated(
@@ -72,7 +73,8 @@ async def get_my_books(
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_active_user),
         page: int = Query(default=1, ge=1, description="Page number"),
-        page_size: int = Query(default=10, ge=1, le=100, description="Items per page")
+        page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
+        book_service: BookService = Depends(get_book_service)
 ) -> PaginatedResponse[BookOut]:
     """Get all books owned by the current user with pagination"""
     books, total = await book_service.get_user_books_paginated(
@@ -97,7 +99,10 @@ async def get_my_books(
     description="Get a single book by its UUID.",
     responses=PUBLIC_RESPONSES
 )
-async def get_book(book_uuid: uuid.UUID, session: AsyncSession = Depends(get_session)) -> BookOut:
+async def get_book(
+        book_uuid: uuid.UUID, session: AsyncSession = Depends(get_session),
+        book_service: BookService = Depends(get_book_service)
+) -> BookOut:
     """Get a single book by UUID"""
     book = await book_service.get_book(book_uuid, session)
     if not book:
@@ -116,7 +121,8 @@ async def get_book(book_uuid: uuid.UUID, session: AsyncSession = Depends(get_ses
 async def create_book(
         book: BookCreate,
         session: AsyncSession = Depends(get_session),
-        current_user: Optional[User] = Depends(get_current_active_user)
+        current_user: Optional[User] = Depends(get_current_active_user),
+        book_service: BookService = Depends(get_book_service)
 ) -> BookOut:
     """Create a new book (associated with authenticated user)"""
     new_book = await book_service.create_book(book, session, user_id=current_user.id if current_user else None)
@@ -135,7 +141,8 @@ async def update_book(
         book_uuid: uuid.UUID,
         book_update_data: BookUpdate,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        book_service: BookService = Depends(get_book_service)
 ) -> BookOut:
     """Update a book by UUID (only owner can update)"""
     updated_book = await book_service.update_book(book_uuid, book_update_data, session, current_user)
@@ -152,7 +159,8 @@ async def update_book(
 async def delete_book(
         book_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        book_service: BookService = Depends(get_book_service)
 ) -> None:
     """Delete a book by UUID (only owner can delete)"""
     await book_service.delete_book(book_uuid, session, current_user)
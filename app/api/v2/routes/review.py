@@ -25,6 +25,7 @@ from app.schemas.review import (
     ReviewWithBook,
     ReviewFull
 )
+from app.services import get_review_service
 from app.services.review_service import ReviewService
 
 review_router = APIRouter(
@@ -32,7 +33,6 @@ review_router = APIRouter(
     tags=["Reviews"],
 )
 
-review_service = ReviewService()
 
 
 @review_router.get(
@@ -48,7 +48,8 @@ async def get_all_reviews(
         page: int = Query(default=1, ge=1, description="Page number"),
         page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
         min_rating: Optional[int] = Query(default=None, ge=1, le=5, description="Minimum rating filter"),
-        max_rating: Optional[int] = Query(default=None, ge=1, le=5, description="Maximum rating filter")
+        max_rating: Optional[int] = Query(default=None, ge=1, le=5, description="Maximum rating filter"),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> PaginatedResponse[ReviewFull]:
     """Get all reviews with pagination."""
     reviews, total = await review_service.get_all_reviews_paginated(
@@ -78,7 +79,8 @@ async def get_my_reviews(
         session: AsyncSession = Depends(get_session),
         current_user: User = Depends(get_current_active_user),
         page: int = Query(default=1, ge=1, description="Page number"),
-        page_size: int = Query(default=10, ge=1, le=100, description="Items per page")
+        page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> PaginatedResponse[ReviewWithBook]:
     """Get current user's reviews with pagination."""
     reviews, total = await review_service.get_my_reviews_paginated(
@@ -107,7 +109,8 @@ async def get_reviews_by_book(
         book_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
         page: int = Query(default=1, ge=1, description="Page number"),
-        page_size: int = Query(default=10, ge=1, le=100, description="Items per page")
+        page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> PaginatedResponse[ReviewWithReviewer]:
     """Get all reviews for a book with pagination."""
     reviews, total = await review_service.get_reviews_by_book_paginated(
@@ -133,7 +136,8 @@ async def get_reviews_by_book(
 )
 async def get_book_rating_stats(
         book_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> dict:
     """Get average rating for a book."""
     return await review_service.get_book_average_rating(book_uuid, session)
@@ -151,7 +155,8 @@ async def get_reviews_by_user(
         user_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
         page: int = Query(default=1, ge=1, description="Page number"),
-        page_size: int = Query(default=10, ge=1, le=100, description="Items per page")
+        page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> PaginatedResponse[ReviewWithBook]:
     """Get all reviews by a user with pagination."""
     reviews, total = await review_service.get_reviews_by_user_paginated(
@@ -178,7 +183,8 @@ async def get_reviews_by_user(
 )
 async def get_review(
         review_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> ReviewFull:
     """Get a review by UUID."""
     review = await review_service.get_review_by_uuid(review_uuid, session)
@@ -199,7 +205,8 @@ async def create_review(
         book_uuid: uuid.UUID,
         review_data: ReviewCreate,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> ReviewFull:
     """Create a new review for a book."""
     return await review_service.create_review(book_uuid, review_data, current_user, session)
@@ -217,7 +224,8 @@ async def update_review(
         review_uuid: uuid.UUID,
         review_data: ReviewUpdate,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> ReviewFull:
     """Update a review."""
     return await review_service.update_review(review_uuid, review_data, current_user, session)
@@ -234,7 +242,8 @@ async def update_review(
 async def delete_review(
         review_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        review_service: ReviewService = Depends(get_review_service)
 ) -> MessageResponse:
     """Delete a review."""
     result = await review_service.delete_review(review_uuid, current_user, session)
@@ -15,6 +15,7 @@ from app.core.database import get_session
 from app.core.exceptions import UserNotFoundException
 from app.core.responses import PUBLIC_RESPONSES, AUTH_RESPONSES
 from app.core.security import get_current_active_user
+from app.core.user_cache import invalidate_user_cache
 from app.models.user import User
 from app.schemas.auth import MessageResponse
 from app.schemas.pagination import PaginatedResponse
@@ -24,6 +25,7 @@ from app.schemas.user import (
     UserUpdate,
     PasswordChange
 )
+from app.services import get_user_service
 from app.services.user_services import UserService
 
 user_router = APIRouter(
@@ -31,7 +33,6 @@ user_router = APIRouter(
     tags=["Users"],
 )
 
-user_service = UserService()
 
 
 @user_router.get(
@@ -44,7 +45,8 @@ user_service = UserService()
 )
 async def get_me(
         current_user: User = Depends(get_current_active_user),
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
 ) -> UserWithBooks:
     """Get current authenticated user."""
     user = await user_service.get_user_by_uuid(current_user.uuid, session)
@@ -62,7 +64,8 @@ async def get_me(
 async def change_password(
         password_data: PasswordChange,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> MessageResponse:
     """Change current user's password."""
     result = await user_service.change_password(
@@ -72,6 +75,7 @@ async def change_password(
         session=session,
         current_user=current_user
     )
+    await invalidate_user_cache(current_user.uuid, current_user.email)
     return MessageResponse(**result)
 
 
@@ -87,7 +91,8 @@ async def get_all_users(
         session: AsyncSession = Depends(get_session),
         page: int = Query(default=1, ge=1, description="Page number"),
         page_size: int = Query(default=10, ge=1, le=100, description="Items per page"),
-        search: Optional[str] = Query(default=None, description="Search in username and email")
+        search: Optional[str] = Query(default=None, description="Search in username and email"),
+        user_service: UserService = Depends(get_user_service)
 ) -> PaginatedResponse[ShowUser]:
     """Get all users with pagination."""
     users, total = await user_service.get_all_users_paginated(
@@ -114,7 +119,8 @@ async def get_all_users(
 )
 async def get_user_by_email(
         email: str,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Get a user by email."""
     user = await user_service.get_user_by_email(email, session)
@@ -133,7 +139,8 @@ async def get_user_by_email(
 )
 async def get_user_by_uuid(
         user_uuid: uuid.UUID,
-        session: AsyncSession = Depends(get_session)
+        session: AsyncSession = Depends(get_session),
+        user_service: UserService = Depends(get_user_service)
 ) -> UserWithBooks:
     """Get a user by UUID."""
     user = await user_service.get_user_by_uuid(user_uuid, session)
@@ -154,12 +161,18 @@ async def update_user(
         user_uuid: uuid.UUID,
         update_data: UserUpdate,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> ShowUser:
     """Update a user."""
+    # Capture the pre-update email so a changed address does not leave a
+    # stale entry behind.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
+    old_email = target.email if target else None
     updated_user = await user_service.update_user(
         user_uuid, update_data, session, current_user
     )
+    await invalidate_user_cache(user_uuid, old_email, updated_user.email)
     return updated_user
 
 
@@ -174,8 +187,13 @@ async def update_user(
 async def delete_user(
         user_uuid: uuid.UUID,
         session: AsyncSession = Depends(get_session),
-        current_user: User = Depends(get_current_active_user)
+        current_user: User = Depends(get_current_active_user),
+        user_service: UserService = Depends(get_user_service)
 ) -> MessageResponse:
     """Delete a user."""
+    # Look the user up first so their cache entries can be dropped after
+    # the row is gone.
+    target = await user_service.get_user_by_uuid(user_uuid, session)
     result = await user_service.delete_user(user_uuid, session, current_user)
+    await invalidate_user_cache(user_uuid, target.email if target else None)
     return MessageResponse(**result)
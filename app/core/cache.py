@@ -0,0 +1,62 @@
+"""
+Short-TTL response caching backed by the shared Redis pool.
+
+Used by hot read-only endpoints to collapse repeated identical requests
+into one DB hit. Like the token blacklist, caching fails open: when
+Redis is unavailable, reads just miss and writes are skipped.
+"""
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.exceptions import ConnectionError, RedisError
+
+from app.core.redis import redis_pool
+
+logger = logging.getLogger(__name__)
+
+# Shares the app-wide connection pool with the token blacklist
+cache_client = redis.Redis(connection_pool=redis_pool)
+
+# Key prefix for cached responses
+CACHE_PREFIX = "cache:"
+
+
+async def get_cached_response(key: str) -> Optional[bytes]:
+    """Return a cached response body, or None on miss or Redis failure."""
+    try:
+        return await cache_client.get(f"{CACHE_PREFIX}{key}")
+    except (ConnectionError, RedisError) as e:
+        logger.warning(f"Redis unavailable when reading cache: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Unexpected error reading cache: {e}")
+        return None
+
+
+async def set_cached_response(key: str, body: bytes, ttl: int) -> bool:
+    """Store a response body with a TTL in seconds."""
+    try:
+        await cache_client.setex(f"{CACHE_PREFIX}{key}", ttl, body)
+        return True
+    except (ConnectionError, RedisError) as e:
+        logger.warning(f"Redis unavailable when writing cache: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error writing cache: {e}")
+        return False
+
+
+async def invalidate_cached_response(*keys: str) -> bool:
+    """Delete one or more cached responses (used on writes)."""
+    if not keys:
+        return True
+    try:
+        await cache_client.delete(*[f"{CACHE_PREFIX}{key}" for key in keys])
+        return True
+    except (ConnectionError, RedisError) as e:
+        logger.warning(f"Redis unavailable when invalidating cache: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error invalidating cache: {e}")
+        return False
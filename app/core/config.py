@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -36,6 +37,10 @@ class Settings(BaseSettings):
     GITHUB_CLIENT_SECRET: Optional[str] = None
     OAUTH_REDIRECT_BASE_URL: str = "http://localhost:8000"
 
+    # Migration settings: skip (run via alembic CLI), sync (block
+    # startup until migrated), or async (migrate in the background)
+    MIGRATION_MODE: str = "skip"
+
     # Rate Limiting settings
     RATE_LIMIT_ENABLED: bool = True
     RATE_LIMIT_DEFAULT: str = "100/minute"
@@ -52,7 +57,28 @@ class Settings(BaseSettings):
         env_file=str(BASE_DIR / ".env"),
         env_file_encoding="utf-8",
         extra="ignore",
+        # Immutable and therefore hashable, so settings can key lru_cache
+        # lookups and nothing can mutate configuration at runtime
+        frozen=True,
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build (once) and return the application settings.
+
+    Constructing Settings reads and parses .env, so it is deferred until
+    first use instead of running at import time, and cached afterwards.
+    Tests can swap configuration via Depends(get_settings) overrides or
+    get_settings.cache_clear() instead of monkey-patching the module
+    global.
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Keep `from app.core.config import settings` working without paying
+    # the .env parse when only BASE_DIR or Settings itself is imported.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,10 @@ from fastapi import HTTPException, status
 class BookAPIException(HTTPException):
     """Base exception for BookAPI."""
 
+    # None of these subclasses add attributes beyond HTTPException's, so
+    # empty slots keep each raised instance from growing its own __dict__.
+    __slots__ = ()
+
     def __init__(
             self,
             status_code: int,
@@ -20,6 +24,7 @@ class BookAPIException(HTTPException):
 
 class NotFoundException(BookAPIException):
     """Resource not found exception."""
+    __slots__ = ()
 
     def __init__(self, resource: str, identifier: Any):
         super().__init__(
@@ -30,6 +35,7 @@ class NotFoundException(BookAPIException):
 
 class BookNotFoundException(NotFoundException):
     """Book not found exception."""
+    __slots__ = ()
 
     def __init__(self, book_id: Any):
         super().__init__(resource="Book", identifier=book_id)
@@ -37,6 +43,7 @@ class BookNotFoundException(NotFoundException):
 
 class UserNotFoundException(NotFoundException):
     """User not found exception."""
+    __slots__ = ()
 
     def __init__(self, user_id: Any):
         super().__init__(resource="User", identifier=user_id)
@@ -44,6 +51,7 @@ class UserNotFoundException(NotFoundException):
 
 class ReviewNotFoundException(NotFoundException):
     """Review not found exception."""
+    __slots__ = ()
 
     def __init__(self, review_id: Any):
         super().__init__(resource="Review", identifier=review_id)
@@ -51,6 +59,7 @@ class ReviewNotFoundException(NotFoundException):
 
 class DuplicateResourceException(BookAPIException):
     """Resource already exists exception."""
+    __slots__ = ()
 
     def __init__(self, resource: str, field: str, value: Any):
         super().__init__(
@@ -61,6 +70,7 @@ class DuplicateResourceException(BookAPIException):
 
 class DuplicateEmailException(DuplicateResourceException):
     """Email already registered."""
+    __slots__ = ()
 
     def __init__(self, email: str):
         super().__init__(resource="User", field="email", value=email)
@@ -68,6 +78,7 @@ class DuplicateEmailException(DuplicateResourceException):
 
 class DuplicateUsernameException(DuplicateResourceException):
     """Username already taken."""
+    __slots__ = ()
 
     def __init__(self, username: str):
         super().__init__(resource="User", field="username", value=username)
@@ -75,6 +86,7 @@ class DuplicateUsernameException(DuplicateResourceException):
 
 class DuplicateReviewException(BookAPIException):
     """User already reviewed this book."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -85,6 +97,7 @@ class DuplicateReviewException(BookAPIException):
 
 class UnauthorizedException(BookAPIException):
     """Authentication required exception."""
+    __slots__ = ()
 
     def __init__(self, detail: str = "Authentication required"):
         super().__init__(
@@ -96,6 +109,7 @@ class UnauthorizedException(BookAPIException):
 
 class InvalidCredentialsException(UnauthorizedException):
     """Invalid login credentials."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(detail="Invalid email or password")
@@ -103,6 +117,7 @@ class InvalidCredentialsException(UnauthorizedException):
 
 class TokenExpiredException(UnauthorizedException):
     """Token has expired."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(detail="Token has expired")
@@ -110,6 +125,7 @@ class TokenExpiredException(UnauthorizedException):
 
 class InvalidTokenException(UnauthorizedException):
     """Invalid token."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(detail="Invalid or malformed token")
@@ -117,6 +133,7 @@ class InvalidTokenException(UnauthorizedException):
 
 class EmailNotVerifiedException(BookAPIException):
     """Email not verified exception."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -127,6 +144,7 @@ class EmailNotVerifiedException(BookAPIException):
 
 class InvalidVerificationTokenException(BookAPIException):
     """Invalid or expired verification token."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -137,6 +155,7 @@ class InvalidVerificationTokenException(BookAPIException):
 
 class EmailAlreadyVerifiedException(BookAPIException):
     """Email already verified."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -147,6 +166,7 @@ class EmailAlreadyVerifiedException(BookAPIException):
 
 class EmailSendingException(BookAPIException):
     """Failed to send email."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -157,6 +177,7 @@ class EmailSendingException(BookAPIException):
 
 class ForbiddenException(BookAPIException):
     """Access forbidden exception."""
+    __slots__ = ()
 
     def __init__(self, detail: str = "You don't have permission to perform this action"):
         super().__init__(
@@ -167,6 +188,7 @@ class ForbiddenException(BookAPIException):
 
 class OwnershipRequiredException(ForbiddenException):
     """Resource ownership required."""
+    __slots__ = ()
 
     def __init__(self, resource: str):
         super().__init__(detail=f"You can only modify your own {resource}")
@@ -174,6 +196,7 @@ class OwnershipRequiredException(ForbiddenException):
 
 class AdminRequiredException(ForbiddenException):
     """Admin role required."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(detail="Admin privileges required")
@@ -181,6 +204,7 @@ class AdminRequiredException(ForbiddenException):
 
 class InactiveUserException(ForbiddenException):
     """User account is inactive."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(detail="Your account has been deactivated")
@@ -188,6 +212,7 @@ class InactiveUserException(ForbiddenException):
 
 class ValidationException(BookAPIException):
     """Validation error exception."""
+    __slots__ = ()
 
     def __init__(self, detail: str):
         super().__init__(
@@ -198,6 +223,7 @@ class ValidationException(BookAPIException):
 
 class PasswordValidationException(ValidationException):
     """Password validation failed."""
+    __slots__ = ()
 
     def __init__(self, detail: str = "Password does not meet requirements"):
         super().__init__(detail=detail)
@@ -205,6 +231,7 @@ class PasswordValidationException(ValidationException):
 
 class IncorrectPasswordException(BookAPIException):
     """Current password is incorrect."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -215,6 +242,7 @@ class IncorrectPasswordException(BookAPIException):
 
 class ServiceUnavailableException(BookAPIException):
     """External service unavailable."""
+    __slots__ = ()
 
     def __init__(self, service: str = "Service"):
         super().__init__(
@@ -225,6 +253,7 @@ class ServiceUnavailableException(BookAPIException):
 
 class RedisUnavailableException(ServiceUnavailableException):
     """Redis service unavailable."""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(service="Token revocation service")
@@ -3,6 +3,7 @@ Logging configuration for the BookAPI application.
 """
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
 
@@ -22,15 +23,17 @@ def setup_logging(
             "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
         )
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format=log_format,
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Configure the root logger directly: build one Formatter up front
+    # and attach the handler ourselves. basicConfig silently does
+    # nothing when handlers already exist, so repeated setup calls
+    # (tests, workers) would otherwise keep stale formatting.
+    formatter = logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(formatter)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.handlers = [handler]
 
     # Configure specific loggers
 
@@ -52,10 +55,15 @@ def setup_logging(
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
 
+    Memoized: getLogger takes the logging module's lock on every call,
+    and loggers are process-wide singletons anyway, so callers that
+    fetch one per request skip the lock entirely.
+
     Args:
         name: Logger name (usually __name__)
 
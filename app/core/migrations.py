@@ -0,0 +1,106 @@
+"""
+Startup migration handling.
+
+Running ``alembic upgrade head`` synchronously at boot means the app
+serves no traffic until every migration finishes — minutes of downtime
+when a migration backfills a large table. MIGRATION_MODE controls this:
+
+- ``skip`` (default): migrations are run out-of-band (alembic CLI).
+- ``sync``: run migrations before the app starts serving requests.
+- ``async``: kick migrations off in the background and start serving
+  immediately; progress is exposed on ``app.state.migration_status``
+  and reported by the /health endpoint.
+"""
+import asyncio
+import logging
+
+from anyio import to_thread
+
+from app.core.config import BASE_DIR, settings
+
+logger = logging.getLogger("bookapi")
+
+# Possible values of app.state.migration_status
+MIGRATION_SKIPPED = "skipped"
+MIGRATION_PENDING = "pending"
+MIGRATION_RUNNING = "running"
+MIGRATION_SUCCEEDED = "succeeded"
+MIGRATION_FAILED = "failed"
+
+
+# Computed once per process: walking the versions/ directory imports
+# every revision module, which is wasted work on each worker when the
+# database is already migrated.
+_script_heads = None
+
+
+def _get_script_heads(cfg):
+    """Return the head revision(s) of the migration scripts, cached."""
+    global _script_heads
+    if _script_heads is None:
+        from alembic.script import ScriptDirectory
+
+        _script_heads = set(ScriptDirectory.from_config(cfg).get_heads())
+    return _script_heads
+
+
+def _database_is_current(cfg) -> bool:
+    """Check whether alembic_version already matches the script heads."""
+    from sqlalchemy import create_engine, text
+
+    # Alembic needs a sync driver; strip the async driver suffix
+    url = settings.DATABASE_URL.replace("+asyncpg", "").replace("+aiosqlite", "")
+    engine = create_engine(url, poolclass=None)
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = {row[0] for row in rows}
+    except Exception:
+        # Missing table or unreachable DB: let alembic handle it
+        return False
+    finally:
+        engine.dispose()
+    return current == _get_script_heads(cfg)
+
+
+def _upgrade_to_head() -> None:
+    """Run alembic upgrade head (blocking; call from a worker thread)."""
+    from alembic import command
+    from alembic.config import Config
+
+    cfg = Config(str(BASE_DIR / "alembic.ini"))
+    if _database_is_current(cfg):
+        logger.info("Database already at migration head; skipping upgrade")
+        return
+    command.upgrade(cfg, "head")
+
+
+async def _run_and_record(app) -> None:
+    """Run the upgrade in a thread and record the outcome on app state."""
+    app.state.migration_status = MIGRATION_RUNNING
+    try:
+        await to_thread.run_sync(_upgrade_to_head)
+    except Exception:
+        app.state.migration_status = MIGRATION_FAILED
+        logger.exception("Startup migration failed")
+        raise
+    app.state.migration_status = MIGRATION_SUCCEEDED
+    logger.info("Startup migration completed")
+
+
+async def run_startup_migrations(app) -> None:
+    """Apply MIGRATION_MODE at application startup."""
+    mode = settings.MIGRATION_MODE
+    if mode == "skip":
+        app.state.migration_status = MIGRATION_SKIPPED
+        return
+
+    app.state.migration_status = MIGRATION_PENDING
+    if mode == "sync":
+        await _run_and_record(app)
+    elif mode == "async":
+        # Serve traffic immediately; the advisory lock in alembic/env.py
+        # keeps concurrent workers from migrating at the same time.
+        asyncio.create_task(_run_and_record(app))
+    else:
+        raise ValueError(f"Unknown MIGRATION_MODE: {mode!r}")
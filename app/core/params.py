@@ -0,0 +1,26 @@
+"""
+Shared request-parameter types.
+
+Hot single-row GET endpoints take their UUID path params as pattern-
+checked strings: the regex rejects malformed input up front (no
+exception-driven uuid.UUID validator in the dispatch path), and the
+actual UUID object is built once via a small LRU so repeated lookups of
+popular IDs skip re-parsing entirely.
+"""
+import uuid
+from functools import lru_cache
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Matches canonical UUID strings
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+# Path/query parameter type for prevalidated UUID strings
+UUIDStr = Annotated[str, StringConstraints(pattern=UUID_PATTERN)]
+
+
+@lru_cache(maxsize=4096)
+def parse_uuid(value: str) -> uuid.UUID:
+    """Convert a prevalidated UUID string, caching hot IDs."""
+    return uuid.UUID(value)
@@ -1,7 +1,8 @@
 """
 Standard HTTP status codes and response schemas for API documentation.
 """
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from pydantic import BaseModel
 
@@ -69,7 +70,11 @@ class HTTPStatus:
 # Common Response Definitions for OpenAPI
 # =============================================================================
 
-COMMON_RESPONSES: Dict[int, Dict[str, Any]] = {
+# The response sets below are consumed once per route at schema-build
+# time and shared across every router; read-only proxies keep the many
+# decorators pointing at one object and stop accidental mutation from
+# leaking into every route's docs.
+COMMON_RESPONSES: Mapping[int, Dict[str, Any]] = MappingProxyType({
     400: {
         "description": "Bad Request - Invalid input or duplicate resource",
         "model": ErrorResponse,
@@ -190,44 +195,44 @@ COMMON_RESPONSES: Dict[int, Dict[str, Any]] = {
             }
         }
     }
-}
+})
 
 # =============================================================================
 # Route-specific Response Sets
 # =============================================================================
 
 # For routes that don't require authentication
-PUBLIC_RESPONSES = {
+PUBLIC_RESPONSES: Mapping[int, Dict[str, Any]] = MappingProxyType({
     404: COMMON_RESPONSES[404],
     500: COMMON_RESPONSES[500]
-}
+})
 
 # For routes that require authentication
-AUTH_RESPONSES = {
+AUTH_RESPONSES: Mapping[int, Dict[str, Any]] = MappingProxyType({
     401: COMMON_RESPONSES[401],
     403: COMMON_RESPONSES[403],
     404: COMMON_RESPONSES[404],
     500: COMMON_RESPONSES[500]
-}
+})
 
 # For routes that create resources
-CREATE_RESPONSES = {
+CREATE_RESPONSES: Mapping[int, Dict[str, Any]] = MappingProxyType({
     400: COMMON_RESPONSES[400],
     401: COMMON_RESPONSES[401],
     403: COMMON_RESPONSES[403],
     422: COMMON_RESPONSES[422],
     500: COMMON_RESPONSES[500]
-}
+})
 
 # For admin-only routes
-ADMIN_RESPONSES = {
+ADMIN_RESPONSES: Mapping[int, Dict[str, Any]] = MappingProxyType({
     400: COMMON_RESPONSES[400],
     401: COMMON_RESPONSES[401],
     403: COMMON_RESPONSES[403],
     404: COMMON_RESPONSES[404],
     422: COMMON_RESPONSES[422],
     500: COMMON_RESPONSES[500]
-}
+})
 
 # =============================================================================
 # Status Code Descriptions for Documentation
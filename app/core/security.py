@@ -1,34 +1,147 @@
+import hashlib
+import time
 import uuid
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, List
 
+import bcrypt
 import jwt
+from anyio import to_thread
+from cachetools import LRUCache, TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt import InvalidTokenError
-from passlib.context import CryptContext
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.redis import check_token_blacklists
+# Imported for their mapper registrations: the module-level statement
+# below resolves User.books/User.reviews at import time.
+from app.models.book import Book  # noqa: F401
+from app.models.review import Review  # noqa: F401
 from app.models.user import User, UserRole
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Signing material prepared once: PyJWT re-derives key bytes from a str
+# key on every encode/decode, and a fresh algorithms list / options dict
+# per call is avoidable allocation on the auth hot path. HS* keys are
+# just the secret bytes.
+_SIGNING_KEY = settings.SECRET_KEY.encode("utf-8")
+_ALGORITHMS = [settings.ALGORITHM]
+_DECODE_OPTIONS = {"require": ["exp"]}
+
+# Auth failures are fixed-detail responses, so the exception objects
+# (and their header dicts) are built once here instead of per request —
+# FastAPI is fine with the same instance being raised repeatedly.
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_REVOKED_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Token has been revoked",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_INACTIVE_EXC = HTTPException(
+    status_code=status.HTTP_400_BAD_REQUEST,
+    detail="Inactive user",
+)
+_ADMIN_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Admin access required",
+)
+_MODERATOR_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Moderator access required",
+)
+_FORBIDDEN_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="You don't have permission to access this resource",
+)
+
+# Verified-payload cache: bursty clients present the same bearer token
+# for many consecutive requests, and each decode pays HMAC verification
+# plus JSON parsing. The TTL is far below token lifetime, and the
+# blacklist checks still run on every request, so revocation latency is
+# unchanged.
+_payload_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Authenticated-user cache: the JWT already pins the uuid, yet every
+# request re-selected the user row. Cached column values rebuild a
+# detached User good for the same attribute reads as the auth query
+# (relationships never load there anyway). Writes to a user must
+# call invalidate_cached_user; the short TTL bounds cross-worker
+# staleness for e.g. deactivations.
+_user_cache: TTLCache = TTLCache(maxsize=5_000, ttl=60)
+
+_USER_COLUMN_KEYS = tuple(c.key for c in User.__table__.columns)
+
+# uuid -> primary key. The mapping never changes for a given user, so a
+# plain LRU (no TTL) is enough; it lets the auth miss path use
+# session.get(User, id) — a straight PK lookup with no statement
+# compilation — instead of the uuid SELECT.
+_user_id_by_uuid: LRUCache = LRUCache(maxsize=10_000)
+
+
+def invalidate_cached_user(user_uuid) -> None:
+    """Drop the in-process auth cache entry for one user."""
+    _user_cache.pop(str(user_uuid), None)
+
+# Built once: this statement runs on every authenticated request, so the
+# expression tree and compiled SQL should come from the cache. With the
+# relationships declared lazy="raise_on_sql" this is exactly one query —
+# auth only needs the bare user row; routes that want books (e.g. /me)
+# fetch them through the user service.
+_GET_USER_BY_UUID_STMT = (
+    select(User)
+    .where(User.uuid == bindparam("user_uuid"))
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a plain password against a hashed password.
+
+    Calls bcrypt directly: passlib's CryptContext added scheme lookup
+    and policy checks around the same C routine on every call. The $2b$
+    hash format is unchanged, so existing hashes keep verifying.
+    """
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except ValueError:
+        # Malformed/legacy hash; treat as non-matching
+        return False
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=12)).decode("utf-8")
+
+
+# Deliberately NOT used by request handlers: memoizing real user
+# passwords would keep them in memory and give every duplicate the same
+# salt. Test fixtures and seed scripts hash the same literal passwords
+# over and over, and each call is ~250ms of bcrypt by design.
+hash_password_cached = lru_cache(maxsize=128)(get_password_hash)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread.
+
+    bcrypt burns 50-300ms of CPU by design; running it on the event
+    loop would stall every other request in the worker.
+    """
+    return await to_thread.run_sync(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in a worker thread (see verify_password_async)."""
+    return await to_thread.run_sync(get_password_hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> Tuple[str, str]:
@@ -44,23 +157,23 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
 
-    # Generate unique token ID for revocation tracking
-    jti = str(uuid.uuid4())
+    # Generate unique token ID for revocation tracking (.hex: no dashes)
+    jti = uuid.uuid4().hex
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # One clock read per token; integer claims encode smaller and keep
+    # the iat-vs-blacklist comparison integer-native
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
 
     # Add standard JWT claims
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),  # Issued at
+        "exp": int(expire.timestamp()),
+        "iat": int(now.timestamp()),  # Issued at
         "jti": jti,  # JWT ID for revocation
         "type": "access"
     })
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt, jti
 
 
@@ -77,22 +190,20 @@ def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None)
     """
     to_encode = data.copy()
 
-    # Generate unique token ID for revocation tracking
-    jti = str(uuid.uuid4())
+    # Generate unique token ID for revocation tracking (.hex: no dashes)
+    jti = uuid.uuid4().hex
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(days=7)  # Refresh tokens last 7 days
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(days=7))  # Refresh tokens last 7 days
 
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "exp": int(expire.timestamp()),
+        "iat": int(now.timestamp()),
         "jti": jti,
         "type": "refresh"
     })
 
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt, jti
 
 
@@ -113,7 +224,7 @@ def create_verification_token(email: str) -> str:
         "iat": datetime.now(timezone.utc),
         "type": "verification"
     }
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
 
 
 def verify_verification_token(token: str) -> Optional[str]:
@@ -127,7 +238,7 @@ def verify_verification_token(token: str) -> Optional[str]:
         Email address if valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
         if payload.get("type") != "verification":
             return None
         return payload.get("sub")
@@ -152,7 +263,7 @@ def create_password_reset_token(email: str) -> str:
         "iat": datetime.now(timezone.utc),
         "type": "password_reset"
     }
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
 
 
 def verify_password_reset_token(token: str) -> Optional[str]:
@@ -166,7 +277,7 @@ def verify_password_reset_token(token: str) -> Optional[str]:
         Email address if valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
         if payload.get("type") != "password_reset":
             return None
         return payload.get("sub")
@@ -174,17 +285,41 @@ def verify_password_reset_token(token: str) -> Optional[str]:
         return None
 
 
+def _decode_token_cached(token: str) -> Tuple[dict, Optional[uuid.UUID]]:
+    """Decode and verify a JWT, memoizing payloads for a short window.
+
+    Returns (payload, parsed sub UUID or None): the sub is parsed once
+    on the miss path so repeat requests skip uuid.UUID() as well as the
+    HMAC check. Raises whatever jwt.decode raises on invalid tokens;
+    cached entries re-check exp so an expired token never authenticates
+    from the cache.
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    entry = _payload_cache.get(key)
+    if entry is not None:
+        exp = entry[0].get("exp")
+        if exp is None or exp > time.time():
+            return entry
+        _payload_cache.pop(key, None)
+    payload = jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS, options=_DECODE_OPTIONS)
+    sub = payload.get("sub")
+    try:
+        sub_uuid = uuid.UUID(sub) if sub else None
+    except ValueError:
+        # Non-UUID subs (e.g. email-based verification tokens) are valid
+        # payloads; they just never resolve to a user here.
+        sub_uuid = None
+    entry = (payload, sub_uuid)
+    _payload_cache[key] = entry
+    return entry
+
+
 def decode_token(token: str) -> dict:
     """Decode and verify a JWT token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        return _decode_token_cached(token)[0]
     except InvalidTokenError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _CREDENTIALS_EXC
 
 
 async def get_current_user(
@@ -192,49 +327,41 @@ async def get_current_user(
         session: AsyncSession = Depends(get_session)
 ) -> User:
     """Get the current authenticated user from the JWT token."""
-    # Import here to avoid circular imports
-    from app.core.redis import is_token_blacklisted, is_user_token_blacklisted
-
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    revoked_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Token has been revoked",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload, sub_uuid = _decode_token_cached(token)
         user_uuid: str = payload.get("sub")
         jti: str = payload.get("jti")
         iat: int = payload.get("iat")
 
-        if user_uuid is None:
-            raise credentials_exception
+        if user_uuid is None or sub_uuid is None:
+            raise _CREDENTIALS_EXC
 
     except InvalidTokenError:
-        raise credentials_exception
-
-    # Check if this specific token is blacklisted
-    if jti and await is_token_blacklisted(jti):
-        raise revoked_exception
-
-    # Check if all user tokens before a certain time are blacklisted (logout all devices)
-    if iat and await is_user_token_blacklisted(user_uuid, iat):
-        raise revoked_exception
-
-    # Get user from database
-    statement = select(User).where(User.uuid == uuid.UUID(user_uuid))
-    result = await session.execute(statement)
-    user = result.scalars().first()
+        raise _CREDENTIALS_EXC
+
+    # Both blacklist probes (this token / all of the user's tokens) ride
+    # one pipelined Redis round-trip
+    token_revoked, user_revoked = await check_token_blacklists(jti, user_uuid, iat)
+    if token_revoked or user_revoked:
+        raise _REVOKED_EXC
+
+    # Get user from cache or database
+    cached = _user_cache.get(user_uuid)
+    if cached is not None:
+        return User(**cached)
+
+    user_id = _user_id_by_uuid.get(user_uuid)
+    if user_id is not None:
+        user = await session.get(User, user_id)
+    else:
+        result = await session.execute(_GET_USER_BY_UUID_STMT, {"user_uuid": sub_uuid})
+        user = result.scalars().first()
 
     if user is None:
-        raise credentials_exception
+        raise _CREDENTIALS_EXC
 
+    _user_id_by_uuid[user_uuid] = user.id
+    _user_cache[user_uuid] = {key: getattr(user, key) for key in _USER_COLUMN_KEYS}
     return user
 
 
@@ -243,13 +370,24 @@ async def get_current_active_user(
 ) -> User:
     """Get the current active user."""
     if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
+        raise _INACTIVE_EXC
     return current_user
 
 
+async def get_auth_context(
+        session: AsyncSession = Depends(get_session),
+        current_user: User = Depends(get_current_active_user)
+) -> Tuple[AsyncSession, User]:
+    """Combined session + authenticated-user dependency.
+
+    Mutation routes need both; bundling them mirrors the admin router's
+    context dependency and resolves one Depends instead of two per
+    handler. Sub-dependency caching still applies, so the session and
+    user are each created exactly once per request.
+    """
+    return session, current_user
+
+
 async def get_current_user_optional(
         token: str,
         session: AsyncSession
@@ -259,28 +397,22 @@ async def get_current_user_optional(
     Returns None if token is invalid or user not found.
     Used for GraphQL context where auth is optional.
     """
-    from app.core.redis import is_token_blacklisted, is_user_token_blacklisted
-
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload, sub_uuid = _decode_token_cached(token)
         user_uuid: str = payload.get("sub")
         jti: str = payload.get("jti")
         iat: int = payload.get("iat")
 
-        if user_uuid is None:
-            return None
-
-        # Check if token is blacklisted
-        if jti and await is_token_blacklisted(jti):
+        if user_uuid is None or sub_uuid is None:
             return None
 
-        # Check if all user tokens are blacklisted
-        if iat and await is_user_token_blacklisted(user_uuid, iat):
+        # Both blacklist probes ride one pipelined Redis round-trip
+        token_revoked, user_revoked = await check_token_blacklists(jti, user_uuid, iat)
+        if token_revoked or user_revoked:
             return None
 
         # Get user from database
-        statement = select(User).where(User.uuid == uuid.UUID(user_uuid))
-        result = await session.execute(statement)
+        result = await session.execute(_GET_USER_BY_UUID_STMT, {"user_uuid": sub_uuid})
         user = result.scalars().first()
 
         return user
@@ -304,13 +436,17 @@ class RoleChecker:
     """
 
     def __init__(self, allowed_roles: List[UserRole]):
-        self.allowed_roles = allowed_roles
+        # frozenset gives O(1) membership on every request; the denial
+        # detail is fixed per checker, so render it once here (from the
+        # original list to keep the role order stable).
+        self.allowed_roles = frozenset(allowed_roles)
+        self._detail = f"Access denied. Required roles: {[r.value for r in allowed_roles]}"
 
     async def __call__(self, current_user: User = Depends(get_current_active_user)) -> User:
         if current_user.role not in self.allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {[r.value for r in self.allowed_roles]}"
+                detail=self._detail
             )
         return current_user
 
@@ -326,22 +462,19 @@ async def get_admin_user(
 ) -> User:
     """Dependency that requires admin role."""
     if current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Admin access required"
-        )
+        raise _ADMIN_EXC
     return current_user
 
 
+_MODERATOR_ROLES = frozenset((UserRole.ADMIN, UserRole.MODERATOR))
+
+
 async def get_moderator_user(
         current_user: User = Depends(get_current_active_user)
 ) -> User:
     """Dependency that requires at least moderator role."""
-    if current_user.role not in (UserRole.ADMIN, UserRole.MODERATOR):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Moderator access required"
-        )
+    if current_user.role not in _MODERATOR_ROLES:
+        raise _MODERATOR_EXC
     return current_user
 
 
@@ -366,7 +499,4 @@ def check_resource_ownership_or_admin(
         return True
     if current_user.id == resource_owner_id:
         return True
-    raise HTTPException(
-        status_code=status.HTTP_403_FORBIDDEN,
-        detail="You don't have permission to access this resource"
-    )
+    raise _FORBIDDEN_EXC
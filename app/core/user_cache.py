@@ -0,0 +1,41 @@
+"""
+Cache keys and invalidation for user profile reads.
+
+/me is polled frequently by the frontend while user rows rarely change,
+so profile responses are cached for a few minutes and dropped eagerly on
+any write to the user. Built on the shared fail-open response cache, so
+a Redis outage only means falling back to Postgres.
+"""
+from app.core.cache import invalidate_cached_response
+from app.core.security import invalidate_cached_user
+
+# User rows change rarely; writes invalidate eagerly, so the TTL only
+# bounds staleness from out-of-band changes (e.g. direct DB edits).
+USER_CACHE_TTL = 300
+
+
+def user_uuid_cache_key(user_uuid) -> str:
+    return f"users:uuid:{user_uuid}"
+
+
+def user_email_cache_key(email: str) -> str:
+    return f"users:email:{email}"
+
+
+def user_me_cache_key(user_uuid) -> str:
+    # /me embeds the user's books, so it is keyed separately from the
+    # public profile and also invalidated by book writes.
+    return f"users:me:{user_uuid}"
+
+
+async def invalidate_user_cache(user_uuid, *emails) -> None:
+    """Drop every cached representation of one user.
+
+    Pass both the old and new email when an update may have changed it;
+    falsy entries are ignored. Also drops the in-process auth cache
+    entry so role/active changes take effect on this worker at once.
+    """
+    invalidate_cached_user(user_uuid)
+    keys = [user_uuid_cache_key(user_uuid), user_me_cache_key(user_uuid)]
+    keys.extend(user_email_cache_key(email) for email in emails if email)
+    await invalidate_cached_response(*keys)
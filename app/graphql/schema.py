@@ -56,9 +56,12 @@ def model_to_review_type(review, include_relations: bool = False) -> ReviewType:
     book = None
 
     if include_relations:
-        if hasattr(review, 'reviewer') and review.reviewer:
+        # Only touch relations that the query eager-loaded; unloaded ones
+        # would raise under the models' lazy="raise_on_sql"
+        loaded = review.__dict__
+        if loaded.get('reviewer') is not None:
             reviewer = model_to_user_type(review.reviewer)
-        if hasattr(review, 'book') and review.book:
+        if loaded.get('book') is not None:
             book = model_to_book_type(review.book)
 
     return ReviewType(
@@ -1,7 +1,5 @@
 import uuid as uuid_lib
-from datetime import datetime
-
-from sqlalchemy import Column, String, Integer, Date, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Date, DateTime, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -19,8 +17,10 @@ class Book(Base):
     publish_date = Column(Date, nullable=False)
     pages = Column(Integer, nullable=False)
     language = Column(String(255), nullable=False)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    # DB-side timestamps: no per-row datetime.now() call in Python and
+    # one less bind parameter per INSERT/UPDATE
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Foreign key to User
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -28,8 +28,9 @@ class Book(Base):
     # Relationship to User
     owner = relationship("User", back_populates="books")
 
-    # Relationship to Reviews
-    reviews = relationship("Review", back_populates="book", lazy="selectin", cascade="all, delete-orphan")
+    # Relationship to Reviews (raise_on_sql: loaded only via explicit
+    # selectinload in the queries that serialize them)
+    reviews = relationship("Review", back_populates="book", lazy="raise_on_sql", cascade="all, delete-orphan")
 
     def __repr__(self) -> str:
         return f"Book(id={self.id}, uuid={self.uuid}, title={self.title})"
@@ -1,7 +1,5 @@
 import uuid
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, CheckConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, CheckConstraint, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -15,20 +13,26 @@ class Review(Base):
     uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4, index=True)
     content = Column(String(1000), nullable=False)
     rating = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Foreign keys
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     book_id = Column(Integer, ForeignKey("books.id"), nullable=False)
 
-    # Relationships
-    reviewer = relationship("User", back_populates="reviews", lazy="selectin")
-    book = relationship("Book", back_populates="reviews", lazy="selectin")
+    # Relationships (raise_on_sql: loaded only via explicit selectinload
+    # in the queries that serialize them)
+    reviewer = relationship("User", back_populates="reviews", lazy="raise_on_sql")
+    book = relationship("Book", back_populates="reviews", lazy="raise_on_sql")
 
-    # Constraints
+    # Constraints and indexes for the common query shapes
     __table_args__ = (
         CheckConstraint('rating >= 1 AND rating <= 5', name='rating_range'),
+        UniqueConstraint('user_id', 'book_id', name='uq_reviews_user_book'),
+        Index('ix_reviews_book_created', 'book_id', text('created_at DESC')),
+        # Covers get_book_average_rating with an index-only scan
+        Index('ix_reviews_book_rating', 'book_id', 'rating'),
+        Index('ix_reviews_user', 'user_id'),
     )
 
     def __repr__(self) -> str:
@@ -1,6 +1,8 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.fields import CachedEmailStr
 
 
 class Token(BaseModel):
@@ -8,42 +10,59 @@ class Token(BaseModel):
     refresh_token: str
     token_type: str = "bearer"
 
+    # Response-only model; frozen avoids per-response deep copies
+    model_config = ConfigDict(frozen=True)
+
 
 class TokenData(BaseModel):
+    # Not referenced by any route; defer the core-schema build until
+    # the model is actually used
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     user_uuid: Optional[str] = None
 
 
 class LoginRequest(BaseModel):
-    email: EmailStr
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
+    email: CachedEmailStr
     password: str
 
 
 class RegisterRequest(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
+    email: CachedEmailStr
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
     password: str = Field(..., min_length=8, max_length=100)
 
 
 class RefreshTokenRequest(BaseModel):
+    # Leaf DTOs built once per request and never mutated; frozen skips
+    # per-field assignment hooks and makes the intent explicit
+    model_config = ConfigDict(frozen=True)
+
     refresh_token: str
 
 
 class MessageResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
 
 
 class VerifyEmailRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     token: str
 
 
 class ResendVerificationRequest(BaseModel):
-    email: EmailStr
+    email: CachedEmailStr
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    email: CachedEmailStr
 
 
 class ResetPasswordRequest(BaseModel):
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, date
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BookBase(BaseModel):
@@ -38,4 +38,6 @@ class BookUpdate(BaseModel):
 
 
 class BookOut(BookBase):
-    model_config = {"from_attributes": True}
+    # frozen lets pydantic-core skip deep copies and reuse the cached
+    # serializer for this response-only model
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,28 @@
+"""Shared request-field types.
+
+CachedEmailStr is a drop-in for pydantic's EmailStr on request models.
+email-validator re-parses the address on every call; login and
+verification traffic repeats the same handful of addresses (retry
+storms, polling clients), so a small LRU skips the redundant work.
+DNS deliverability checks are off, matching EmailStr's own default.
+"""
+from functools import lru_cache
+from typing import Annotated
+
+from email_validator import validate_email
+from pydantic import AfterValidator, WithJsonSchema
+
+
+@lru_cache(maxsize=1024)
+def _validate_email_cached(value: str) -> str:
+    """Validate and normalize an email address, memoizing recent ones."""
+    return validate_email(value, check_deliverability=False).normalized
+
+
+# WithJsonSchema keeps the documented type as format: email, matching
+# what EmailStr advertises in /openapi.json.
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(_validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
@@ -3,7 +3,7 @@ OAuth2 Social Login Schemas
 """
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class OAuthUserInfo(BaseModel):
@@ -19,12 +19,18 @@ class OAuthUserInfo(BaseModel):
 
 class OAuthCallbackRequest(BaseModel):
     """OAuth callback request"""
+    # Not referenced by any route; defer the core-schema build until
+    # the model is actually used
+    model_config = ConfigDict(defer_build=True)
+
     code: str
     state: Optional[str] = None
 
 
 class OAuthTokenResponse(BaseModel):
     """OAuth token response"""
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str
     refresh_token: str
     token_type: str = "bearer"
@@ -33,6 +39,8 @@ class OAuthTokenResponse(BaseModel):
 
 class OAuthProviderConfig(BaseModel):
     """OAuth provider configuration"""
+    model_config = ConfigDict(defer_build=True)
+
     client_id: str
     client_secret: str
     authorize_url: str
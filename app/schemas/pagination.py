@@ -5,13 +5,17 @@ Provides standardized pagination for V2 API endpoints.
 """
 from typing import TypeVar, Generic, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 T = TypeVar("T")
 
 
 class PaginationParams(BaseModel):
     """Pagination query parameters"""
+    # Not referenced by any route; defer the core-schema build until
+    # the model is actually used
+    model_config = ConfigDict(defer_build=True)
+
     page: int = Field(default=1, ge=1, description="Page number (1-indexed)")
     page_size: int = Field(default=10, ge=1, le=100, description="Items per page (max 100)")
 
@@ -57,12 +61,16 @@ class PaginatedResponse(BaseModel, Generic[T]):
 
 class SortOrder(BaseModel):
     """Sort order specification"""
+    model_config = ConfigDict(defer_build=True)
+
     field: str = Field(..., description="Field to sort by")
     direction: str = Field(default="asc", pattern="^(asc|desc)$", description="Sort direction")
 
 
 class FilterParams(BaseModel):
     """Base filter parameters"""
+    model_config = ConfigDict(defer_build=True)
+
     search: Optional[str] = Field(default=None, description="Search query")
     sort_by: Optional[str] = Field(default=None, description="Field to sort by")
     sort_order: str = Field(default="asc", pattern="^(asc|desc)$", description="Sort direction")
@@ -28,7 +28,8 @@ class ReviewerInfo(BaseModel):
     first_name: str
     last_name: str
 
-    model_config = {"from_attributes": True}
+    # Read-only per-request DTO; frozen avoids per-response deep copies
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class BookInfo(BaseModel):
@@ -37,7 +38,7 @@ class BookInfo(BaseModel):
     title: str
     author: str
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
 
 class ReviewOut(ReviewBase):
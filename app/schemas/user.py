@@ -3,7 +3,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, List
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.fields import CachedEmailStr
 
 
 class UserRole(str, Enum):
@@ -15,7 +17,7 @@ class UserRole(str, Enum):
 
 class UserBase(BaseModel):
     username: str = Field(..., min_length=3, max_length=50)
-    email: EmailStr
+    email: CachedEmailStr
     first_name: str = Field(..., min_length=1, max_length=100)
     last_name: str = Field(..., min_length=1, max_length=100)
 
@@ -34,7 +36,7 @@ class UserCreateAdmin(UserBase):
 
 class UserUpdate(BaseModel):
     username: Optional[str] = Field(None, min_length=3, max_length=50)
-    email: Optional[EmailStr] = None
+    email: Optional[CachedEmailStr] = None
     first_name: Optional[str] = Field(None, min_length=1, max_length=100)
     last_name: Optional[str] = Field(None, min_length=1, max_length=100)
     is_active: Optional[bool] = None
@@ -58,7 +60,9 @@ class ShowUser(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    # frozen lets pydantic-core skip deep copies and reuse the cached
+    # serializer for these response-only models
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Simplified book schema for user response (to avoid circular imports)
@@ -68,13 +72,13 @@ class BookInUser(BaseModel):
     author: str
     publisher: str
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class UserWithBooks(ShowUser):
     books: List[BookInUser] = []
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Aliases for backward compatibility
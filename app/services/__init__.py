@@ -0,0 +1,38 @@
+"""
+Service layer providers for dependency injection.
+
+The services are stateless, so a single instance per process is safe and
+avoids a per-request allocation. Route handlers should depend on the
+``get_*_service`` providers rather than constructing services at import
+time — this keeps the lifetime explicit and lets tests swap in stubs via
+``app.dependency_overrides``.
+"""
+from app.services.auth_services import AuthService
+from app.services.book_service import BookService
+from app.services.review_service import ReviewService
+from app.services.user_services import UserService
+
+_auth_service = AuthService()
+_book_service = BookService()
+_review_service = ReviewService()
+_user_service = UserService()
+
+
+def get_auth_service() -> AuthService:
+    """Provide the shared AuthService instance."""
+    return _auth_service
+
+
+def get_book_service() -> BookService:
+    """Provide the shared BookService instance."""
+    return _book_service
+
+
+def get_review_service() -> ReviewService:
+    """Provide the shared ReviewService instance."""
+    return _review_service
+
+
+def get_user_service() -> UserService:
+    """Provide the shared UserService instance."""
+    return _user_service
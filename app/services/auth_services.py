@@ -1,8 +1,10 @@
+import asyncio
 import time
 import uuid
 from datetime import timedelta
 from typing import Optional
 
+from fastapi import HTTPException
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,8 +12,6 @@ from app.core.config import settings
 from app.core.exceptions import (
     InvalidCredentialsException,
     InactiveUserException,
-    DuplicateEmailException,
-    DuplicateUsernameException,
     InvalidTokenException,
     TokenExpiredException,
     RedisUnavailableException,
@@ -28,8 +28,8 @@ from app.core.redis import (
     blacklist_all_user_tokens
 )
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -44,6 +44,14 @@ from app.services.email_service import email_service
 from app.services.user_services import UserService
 
 
+# Settings never change after startup; building these once avoids a
+# pydantic-settings descriptor lookup and a timedelta per token issued.
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+# Fallback blacklist TTL when a token carries no exp claim: one week,
+# the refresh-token lifetime.
+_REFRESH_DEFAULT_TTL = 7 * 24 * 60 * 60
+
+
 class AuthService:
     def __init__(self):
         self.user_service = UserService()
@@ -58,7 +66,7 @@ class AuthService:
         user = await self.user_service.get_user_by_email(email, session)
         if not user:
             return None
-        if not verify_password(password, user.password):
+        if not await verify_password_async(password, user.password):
             return None
         return user
 
@@ -82,10 +90,9 @@ class AuthService:
             raise EmailNotVerifiedException()
 
         # Create tokens
-        access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token, _ = create_access_token(
             data={"sub": str(user.uuid)},
-            expires_delta=access_token_expires
+            expires_delta=_ACCESS_TOKEN_EXPIRES
         )
         refresh_token, _ = create_refresh_token(
             data={"sub": str(user.uuid)}
@@ -104,18 +111,13 @@ class AuthService:
             send_verification: bool = True
     ) -> User:
         """Register a new user and send verification email."""
-        # Check if email already exists
-        existing_email = await self.user_service.get_user_by_email(user_data.email, session)
-        if existing_email:
-            raise DuplicateEmailException(user_data.email)
-
-        # Check if username already exists
-        existing_username = await self.user_service.get_user_by_username(user_data.username, session)
-        if existing_username:
-            raise DuplicateUsernameException(user_data.username)
+        # One combined SELECT checks both unique columns
+        await self.user_service.ensure_email_username_available(
+            user_data.email, user_data.username, session
+        )
 
         # Hash password and create user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
 
         new_user = User(
             username=user_data.username,
@@ -234,7 +236,7 @@ class AuthService:
             raise UserNotFoundException(email)
 
         # Update password
-        user.password = get_password_hash(new_password)
+        user.password = await get_password_hash_async(new_password)
         session.add(user)
         await session.commit()
 
@@ -263,15 +265,14 @@ class AuthService:
 
         except (ValidationException, RedisUnavailableException):
             raise
-        except Exception:
+        except HTTPException:
+            # decode_token rejected the token
             raise InvalidTokenException()
 
     @staticmethod
     async def logout_all_devices(user_uuid: str) -> dict:
         """Logout from all devices by blacklisting all tokens for a user."""
-        expires_in = 7 * 24 * 60 * 60
-
-        success = await blacklist_all_user_tokens(user_uuid, expires_in)
+        success = await blacklist_all_user_tokens(user_uuid, _REFRESH_DEFAULT_TTL)
 
         if not success:
             raise RedisUnavailableException()
@@ -295,15 +296,24 @@ class AuthService:
             if token_type != "refresh":
                 raise InvalidTokenException()
 
-            jti = payload.get("jti")
-            if jti and await is_token_blacklisted(jti):
-                raise TokenExpiredException()
-
             user_uuid = payload.get("sub")
             if not user_uuid:
                 raise InvalidTokenException()
 
-            user = await self.user_service.get_user_by_uuid(uuid.UUID(user_uuid), session)
+            # The blacklist check (Redis) and the user fetch (Postgres)
+            # are independent round-trips; firing them together hides
+            # the shorter of the two latencies.
+            jti = payload.get("jti")
+            if jti:
+                user, blacklisted = await asyncio.gather(
+                    self.user_service.get_user_by_uuid(uuid.UUID(user_uuid), session),
+                    is_token_blacklisted(jti),
+                )
+                if blacklisted:
+                    raise TokenExpiredException()
+            else:
+                user = await self.user_service.get_user_by_uuid(uuid.UUID(user_uuid), session)
+
             if not user:
                 raise UserNotFoundException(user_uuid)
 
@@ -313,13 +323,12 @@ class AuthService:
             if jti:
                 exp = payload.get("exp")
                 current_time = int(time.time())
-                expires_in = max(exp - current_time, 0) if exp else 7 * 24 * 60 * 60
+                expires_in = max(exp - current_time, 0) if exp else _REFRESH_DEFAULT_TTL
                 await add_token_to_blacklist(jti, expires_in)
 
-            access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
             access_token, _ = create_access_token(
                 data={"sub": str(user.uuid)},
-                expires_delta=access_token_expires
+                expires_delta=_ACCESS_TOKEN_EXPIRES
             )
             new_refresh_token, _ = create_refresh_token(
                 data={"sub": str(user.uuid)}
@@ -332,5 +341,6 @@ class AuthService:
             )
         except (InvalidTokenException, TokenExpiredException, UserNotFoundException, InactiveUserException):
             raise
-        except Exception:
+        except (HTTPException, ValueError):
+            # decode_token rejected the token, or the sub was not a UUID
             raise InvalidTokenException()
@@ -2,8 +2,9 @@ import uuid
 from datetime import date, datetime
 from typing import Optional, List, Tuple
 
-from sqlalchemy import select, desc, asc, func, or_
+from sqlalchemy import bindparam, select, desc, asc, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import (
     BookNotFoundException,
@@ -11,15 +12,45 @@ from app.core.exceptions import (
     ValidationException
 )
 from app.models.book import Book
+# Imported for its mapper registration: the module-level statements below
+# resolve Book.reviews, which configures the Review relationship.
+from app.models.review import Review  # noqa: F401
 from app.models.user import User
 from app.schemas.book import BookCreate, BookUpdate
 
 
+# Hot statements built once at import: expression-tree construction and
+# SQL compilation then become cache hits instead of per-request work.
+_GET_ALL_BOOKS_STMT = (
+    select(Book)
+    .options(selectinload(Book.reviews))
+    # id is monotonic with created_at and lets keyset pagination seek on
+    # the primary-key index instead of skipping OFFSET rows.
+    .order_by(desc(Book.id))
+)
+_GET_BOOK_STMT = (
+    select(Book)
+    .options(selectinload(Book.reviews))
+    .where(Book.uuid == bindparam("book_uuid"))
+)
+
+
 class BookService:
     @staticmethod
-    async def get_all_books(session: AsyncSession) -> List[Book]:
-        statement = select(Book).order_by(desc(Book.created_at))
-        result = await session.execute(statement)
+    async def get_all_books(
+            session: AsyncSession,
+            limit: Optional[int] = None,
+            after: Optional[uuid.UUID] = None
+    ) -> List[Book]:
+        # Eager-load reviews in one batched SELECT so consumers that touch
+        # book.reviews (GraphQL, rating stats) never lazy-load per row.
+        query = _GET_ALL_BOOKS_STMT
+        if after is not None:
+            anchor = select(Book.id).where(Book.uuid == after).scalar_subquery()
+            query = query.where(Book.id < anchor)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await session.execute(query)
         books = result.scalars().all()
         return list(books)
 
@@ -34,7 +65,7 @@ class BookService:
     ) -> Tuple[List[Book], int]:
         """Get all books with pagination, search, and sorting."""
         # Base query
-        query = select(Book)
+        query = select(Book).options(selectinload(Book.reviews))
         count_query = select(func.count(Book.id))
 
         # Apply search filter
@@ -69,7 +100,12 @@ class BookService:
     @staticmethod
     async def get_user_books(user_id: int, session: AsyncSession) -> List[Book]:
         """Get all books owned by a specific user."""
-        statement = select(Book).where(Book.user_id == user_id).order_by(desc(Book.created_at))
+        # BookOut doesn't serialize reviews, so no loader options needed
+        statement = (
+            select(Book)
+            .where(Book.user_id == user_id)
+            .order_by(desc(Book.created_at))
+        )
         result = await session.execute(statement)
         books = result.scalars().all()
         return list(books)
@@ -83,7 +119,7 @@ class BookService:
     ) -> Tuple[List[Book], int]:
         """Get all books owned by a specific user with pagination."""
         # Base query
-        query = select(Book).where(Book.user_id == user_id)
+        query = select(Book).options(selectinload(Book.reviews)).where(Book.user_id == user_id)
         count_query = select(func.count(Book.id)).where(Book.user_id == user_id)
 
         # Get total count
@@ -102,8 +138,7 @@ class BookService:
 
     @staticmethod
     async def get_book(book_uuid: uuid.UUID, session: AsyncSession) -> Optional[Book]:
-        statement = select(Book).where(Book.uuid == book_uuid)
-        result = await session.execute(statement)
+        result = await session.execute(_GET_BOOK_STMT, {"book_uuid": book_uuid})
         book = result.scalars().first()
         return book if book else None
 
@@ -1,5 +1,5 @@
 import uuid
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 
 from sqlalchemy import select, desc, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -29,6 +29,30 @@ class ReviewService:
         result = await session.execute(statement)
         return list(result.scalars().all())
 
+    @staticmethod
+    async def stream_all_reviews(
+            session: AsyncSession,
+            batch_size: int = 500,
+            limit: Optional[int] = None,
+            after: Optional[uuid.UUID] = None
+    ) -> AsyncIterator[Review]:
+        """Stream all reviews in server-side batches instead of loading
+        the whole table into memory at once."""
+        # id is monotonic with created_at; seeking on it keeps keyset
+        # pagination on the primary-key index.
+        statement = select(Review).options(
+            selectinload(Review.reviewer),
+            selectinload(Review.book)
+        ).order_by(desc(Review.id)).execution_options(yield_per=batch_size)
+        if after is not None:
+            anchor = select(Review.id).where(Review.uuid == after).scalar_subquery()
+            statement = statement.where(Review.id < anchor)
+        if limit is not None:
+            statement = statement.limit(limit)
+        result = await session.stream(statement)
+        async for review in result.scalars():
+            yield review
+
     @staticmethod
     async def get_all_reviews_paginated(
             session: AsyncSession,
@@ -181,8 +205,13 @@ class ReviewService:
         return result.scalars().first()
 
     @staticmethod
-    async def get_reviews_by_book(book_uuid: uuid.UUID, session: AsyncSession) -> List[Review]:
-        """Get all reviews for a specific book."""
+    async def get_reviews_by_book(
+            book_uuid: uuid.UUID,
+            session: AsyncSession,
+            limit: Optional[int] = None,
+            after: Optional[uuid.UUID] = None
+    ) -> List[Review]:
+        """Get reviews for a specific book, optionally keyset-paginated."""
         book_statement = select(Book).where(Book.uuid == book_uuid)
         book_result = await session.execute(book_statement)
         book = book_result.scalars().first()
@@ -192,13 +221,23 @@ class ReviewService:
 
         statement = select(Review).where(Review.book_id == book.id).options(
             selectinload(Review.reviewer)
-        ).order_by(desc(Review.created_at))
+        ).order_by(desc(Review.id))
+        if after is not None:
+            anchor = select(Review.id).where(Review.uuid == after).scalar_subquery()
+            statement = statement.where(Review.id < anchor)
+        if limit is not None:
+            statement = statement.limit(limit)
         result = await session.execute(statement)
         return list(result.scalars().all())
 
     @staticmethod
-    async def get_reviews_by_user(user_uuid: uuid.UUID, session: AsyncSession) -> List[Review]:
-        """Get all reviews by a specific user."""
+    async def get_reviews_by_user(
+            user_uuid: uuid.UUID,
+            session: AsyncSession,
+            limit: Optional[int] = None,
+            after: Optional[uuid.UUID] = None
+    ) -> List[Review]:
+        """Get reviews by a specific user, optionally keyset-paginated."""
         user_statement = select(User).where(User.uuid == user_uuid)
         user_result = await session.execute(user_statement)
         user = user_result.scalars().first()
@@ -208,13 +247,20 @@ class ReviewService:
 
         statement = select(Review).where(Review.user_id == user.id).options(
             selectinload(Review.book)
-        ).order_by(desc(Review.created_at))
+        ).order_by(desc(Review.id))
+        if after is not None:
+            anchor = select(Review.id).where(Review.uuid == after).scalar_subquery()
+            statement = statement.where(Review.id < anchor)
+        if limit is not None:
+            statement = statement.limit(limit)
         result = await session.execute(statement)
         return list(result.scalars().all())
 
     @staticmethod
     async def get_my_reviews(current_user: User, session: AsyncSession) -> List[Review]:
         """Get all reviews by the current user."""
+        # ReviewWithBook doesn't serialize the reviewer, so only the
+        # book needs eager loading
         statement = select(Review).where(Review.user_id == current_user.id).options(
             selectinload(Review.book)
         ).order_by(desc(Review.created_at))
@@ -289,9 +335,16 @@ class ReviewService:
 
         session.add(review)
         await session.commit()
-        await session.refresh(review)
 
-        return review
+        # Re-select with eager-loaded relationships (mirrors create_review):
+        # the ReviewFull response serializes reviewer and book, and a plain
+        # refresh() would leave them to lazy-load during serialization.
+        statement = select(Review).where(Review.id == review.id).options(
+            selectinload(Review.reviewer),
+            selectinload(Review.book)
+        )
+        result = await session.execute(statement)
+        return result.scalars().first()
 
     async def delete_review(
             self,
@@ -324,22 +377,17 @@ class ReviewService:
         if not book:
             raise BookNotFoundException(book_uuid)
 
-        statement = select(Review).where(Review.book_id == book.id)
+        # Aggregate in the database instead of streaming every review
+        # into Python just to average them.
+        statement = select(
+            func.avg(Review.rating),
+            func.count(Review.id)
+        ).where(Review.book_id == book.id)
         result = await session.execute(statement)
-        reviews = list(result.scalars().all())
-
-        if not reviews:
-            return {
-                "book_uuid": str(book_uuid),
-                "average_rating": None,
-                "total_reviews": 0
-            }
-
-        total_rating = sum(r.rating for r in reviews)
-        average = round(total_rating / len(reviews), 2)
+        average, total = result.one()
 
         return {
             "book_uuid": str(book_uuid),
-            "average_rating": average,
-            "total_reviews": len(reviews)
+            "average_rating": round(float(average), 2) if average is not None else None,
+            "total_reviews": int(total)
         }
@@ -13,16 +13,28 @@ from app.core.exceptions import (
     OwnershipRequiredException,
     IncorrectPasswordException
 )
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
+from app.models.book import Book
 from app.models.user import User, UserRole
 from app.schemas.user import UserUpdate, UserUpdateAdmin, UserCreateAdmin, UserCreate
 
 
 class UserService:
     @staticmethod
-    async def get_all_users(session: AsyncSession) -> List[User]:
-        """Get all users."""
-        statement = select(User).order_by(desc(User.created_at))
+    async def get_all_users(
+            session: AsyncSession,
+            limit: Optional[int] = None,
+            after: Optional[uuid.UUID] = None
+    ) -> List[User]:
+        """Get all users, optionally keyset-paginated."""
+        # id is monotonic with created_at; seeking on it keeps keyset
+        # pagination on the primary-key index.
+        statement = select(User).order_by(desc(User.id))
+        if after is not None:
+            anchor = select(User.id).where(User.uuid == after).scalar_subquery()
+            statement = statement.where(User.id < anchor)
+        if limit is not None:
+            statement = statement.limit(limit)
         result = await session.execute(statement)
         users = result.scalars().all()
         return list(users)
@@ -66,12 +78,34 @@ class UserService:
 
     @staticmethod
     async def get_user_by_uuid(user_uuid: uuid.UUID, session: AsyncSession) -> Optional[User]:
-        """Get a user by UUID."""
-        statement = select(User).where(User.uuid == user_uuid).options(selectinload(User.books))
+        """Get a user by UUID with their books eagerly loaded.
+
+        UserWithBooks only serializes the books; the relationships are
+        lazy="raise_on_sql", so only the explicit selectinload here adds
+        a query.
+        """
+        statement = select(User).where(User.uuid == user_uuid).options(
+            selectinload(User.books)
+        )
         result = await session.execute(statement)
         user = result.scalars().first()
         return user
 
+    @staticmethod
+    async def get_books_for_user(user_id: int, session: AsyncSession) -> List[Book]:
+        """Get a user's books without re-selecting the user row.
+
+        Used by /users/me, where auth has already fetched the user: one
+        query for the books instead of user + books + nested reviews.
+        """
+        statement = (
+            select(Book)
+            .where(Book.user_id == user_id)
+            .order_by(desc(Book.created_at))
+        )
+        result = await session.execute(statement)
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_user_by_email(email: EmailStr, session: AsyncSession) -> Optional[User]:
         """Get a user by email."""
@@ -88,21 +122,39 @@ class UserService:
         user = result.scalars().first()
         return user
 
+    @staticmethod
+    async def ensure_email_username_available(
+            email: EmailStr,
+            username: str,
+            session: AsyncSession
+    ) -> None:
+        """Raise the matching Duplicate* exception if either is taken.
+
+        One SELECT with OR replaces the separate email and username
+        preflight queries on registration; only the two columns are
+        fetched, and limit(2) is enough to attribute the conflict.
+        """
+        statement = (
+            select(User.email, User.username)
+            .where(or_(User.email == email, User.username == username))
+            .limit(2)
+        )
+        rows = (await session.execute(statement)).all()
+        for row_email, _ in rows:
+            if row_email == email:
+                raise DuplicateEmailException(email)
+        if rows:
+            raise DuplicateUsernameException(username)
+
     @staticmethod
     async def create_user(user_data: UserCreate, session: AsyncSession) -> User:
         """Create a new user (public registration)."""
-        # Check if email already exists
-        existing_email = await UserService.get_user_by_email(user_data.email, session)
-        if existing_email:
-            raise DuplicateEmailException(user_data.email)
-
-        # Check if username already exists
-        existing_username = await UserService.get_user_by_username(user_data.username, session)
-        if existing_username:
-            raise DuplicateUsernameException(user_data.username)
+        await UserService.ensure_email_username_available(
+            user_data.email, user_data.username, session
+        )
 
         # Hash the password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
 
         # Create user with default USER role
         user_dict = user_data.model_dump()
@@ -115,15 +167,15 @@ class UserService:
         await session.refresh(new_user)
         return new_user
 
+    @staticmethod
     async def update_user(
-            self,
             user_uuid: uuid.UUID,
             update_data: UserUpdate,
             session: AsyncSession,
             current_user: User
     ) -> User:
         """Update a user (self or admin)."""
-        user_to_update = await self.get_user_by_uuid(user_uuid, session)
+        user_to_update = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user_to_update:
             raise UserNotFoundException(user_uuid)
@@ -139,13 +191,13 @@ class UserService:
 
         # Check if email is being updated and if it's already taken
         if "email" in update_data_dict:
-            existing_user = await self.get_user_by_email(update_data_dict["email"], session)
+            existing_user = await UserService.get_user_by_email(update_data_dict["email"], session)
             if existing_user and existing_user.uuid != user_uuid:
                 raise DuplicateEmailException(update_data_dict["email"])
 
         # Check if username is being updated and if it's already taken
         if "username" in update_data_dict:
-            existing_user = await self.get_user_by_username(update_data_dict["username"], session)
+            existing_user = await UserService.get_user_by_username(update_data_dict["username"], session)
             if existing_user and existing_user.uuid != user_uuid:
                 raise DuplicateUsernameException(update_data_dict["username"])
 
@@ -157,14 +209,14 @@ class UserService:
         await session.refresh(user_to_update)
         return user_to_update
 
+    @staticmethod
     async def delete_user(
-            self,
             user_uuid: uuid.UUID,
             session: AsyncSession,
             current_user: User
     ) -> dict:
         """Delete a user (self or admin)."""
-        user_to_delete = await self.get_user_by_uuid(user_uuid, session)
+        user_to_delete = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user_to_delete:
             raise UserNotFoundException(user_uuid)
@@ -180,8 +232,8 @@ class UserService:
         await session.commit()
         return {"message": f"User {user_uuid} deleted successfully"}
 
+    @staticmethod
     async def change_password(
-            self,
             user_uuid: uuid.UUID,
             current_password: str,
             new_password: str,
@@ -189,7 +241,7 @@ class UserService:
             current_user: User
     ) -> dict:
         """Change user password."""
-        user = await self.get_user_by_uuid(user_uuid, session)
+        user = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user:
             raise UserNotFoundException(user_uuid)
@@ -199,11 +251,11 @@ class UserService:
             raise OwnershipRequiredException("password")
 
         # Verify current password
-        if not verify_password(current_password, user.password):
+        if not await verify_password_async(current_password, user.password):
             raise IncorrectPasswordException()
 
         # Hash and set new password
-        user.password = get_password_hash(new_password)
+        user.password = await get_password_hash_async(new_password)
         session.add(user)
         await session.commit()
 
@@ -213,24 +265,18 @@ class UserService:
     # Admin-Only Methods
     # =========================================================================
 
+    @staticmethod
     async def admin_create_user(
-            self,
             user_data: UserCreateAdmin,
             session: AsyncSession
     ) -> User:
         """Admin: Create a user with any role."""
-        # Check if email already exists
-        existing_email = await self.get_user_by_email(user_data.email, session)
-        if existing_email:
-            raise DuplicateEmailException(user_data.email)
-
-        # Check if username already exists
-        existing_username = await self.get_user_by_username(user_data.username, session)
-        if existing_username:
-            raise DuplicateUsernameException(user_data.username)
+        await UserService.ensure_email_username_available(
+            user_data.email, user_data.username, session
+        )
 
         # Hash the password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
 
         # Create user with specified role
         user_dict = user_data.model_dump()
@@ -242,14 +288,14 @@ class UserService:
         await session.refresh(new_user)
         return new_user
 
+    @staticmethod
     async def admin_update_user(
-            self,
             user_uuid: uuid.UUID,
             update_data: UserUpdateAdmin,
             session: AsyncSession
     ) -> User:
         """Admin: Update any user including role."""
-        user_to_update = await self.get_user_by_uuid(user_uuid, session)
+        user_to_update = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user_to_update:
             raise UserNotFoundException(user_uuid)
@@ -258,13 +304,13 @@ class UserService:
 
         # Check if email is being updated and if it's already taken
         if "email" in update_data_dict:
-            existing_user = await self.get_user_by_email(update_data_dict["email"], session)
+            existing_user = await UserService.get_user_by_email(update_data_dict["email"], session)
             if existing_user and existing_user.uuid != user_uuid:
                 raise DuplicateEmailException(update_data_dict["email"])
 
         # Check if username is being updated and if it's already taken
         if "username" in update_data_dict:
-            existing_user = await self.get_user_by_username(update_data_dict["username"], session)
+            existing_user = await UserService.get_user_by_username(update_data_dict["username"], session)
             if existing_user and existing_user.uuid != user_uuid:
                 raise DuplicateUsernameException(update_data_dict["username"])
 
@@ -276,13 +322,13 @@ class UserService:
         await session.refresh(user_to_update)
         return user_to_update
 
+    @staticmethod
     async def admin_delete_user(
-            self,
             user_uuid: uuid.UUID,
             session: AsyncSession
     ) -> dict:
         """Admin: Delete any user."""
-        user_to_delete = await self.get_user_by_uuid(user_uuid, session)
+        user_to_delete = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user_to_delete:
             raise UserNotFoundException(user_uuid)
@@ -291,14 +337,14 @@ class UserService:
         await session.commit()
         return {"message": f"User {user_uuid} deleted successfully"}
 
+    @staticmethod
     async def change_user_role(
-            self,
             user_uuid: uuid.UUID,
             new_role: UserRole,
             session: AsyncSession
     ) -> User:
         """Admin: Change a user's role."""
-        user = await self.get_user_by_uuid(user_uuid, session)
+        user = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user:
             raise UserNotFoundException(user_uuid)
@@ -309,14 +355,14 @@ class UserService:
         await session.refresh(user)
         return user
 
+    @staticmethod
     async def toggle_user_active(
-            self,
             user_uuid: uuid.UUID,
             is_active: bool,
             session: AsyncSession
     ) -> User:
         """Admin: Activate or deactivate a user."""
-        user = await self.get_user_by_uuid(user_uuid, session)
+        user = await UserService.get_user_by_uuid(user_uuid, session)
 
         if not user:
             raise UserNotFoundException(user_uuid)
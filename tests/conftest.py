@@ -12,7 +12,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base, get_session
-from app.core.security import get_password_hash
+from app.core.security import hash_password_cached
 from app.main import app
 from app.models.book import Book
 from app.models.user import User, UserRole
@@ -83,7 +83,7 @@ async def test_user(db_session: AsyncSession) -> User:
         email="test@example.com",
         first_name="Test",
         last_name="User",
-        password=get_password_hash("testpassword123"),
+        password=hash_password_cached("testpassword123"),
         role=UserRole.USER,
         is_active=True,
         is_verified=True  # User must be verified to login
@@ -102,7 +102,7 @@ async def test_admin(db_session: AsyncSession) -> User:
         email="admin@example.com",
         first_name="Admin",
         last_name="User",
-        password=get_password_hash("adminpassword123"),
+        password=hash_password_cached("adminpassword123"),
         role=UserRole.ADMIN,
         is_active=True,
         is_verified=True  # User must be verified to login
@@ -121,7 +121,7 @@ async def test_moderator(db_session: AsyncSession) -> User:
         email="mod@example.com",
         first_name="Mod",
         last_name="User",
-        password=get_password_hash("modpassword123"),
+        password=hash_password_cached("modpassword123"),
         role=UserRole.MODERATOR,
         is_active=True,
         is_verified=True  # User must be verified to login
@@ -140,7 +140,7 @@ async def unverified_user(db_session: AsyncSession) -> User:
         email="unverified@example.com",
         first_name="Unverified",
         last_name="User",
-        password=get_password_hash("testpassword123"),
+        password=hash_password_cached("testpassword123"),
         role=UserRole.USER,
         is_active=True,
         is_verified=False  # User is not verified
@@ -205,3 +205,29 @@ async def auth_headers(user_token: str) -> dict:
 async def admin_headers(admin_token: str) -> dict:
     """Get authorization headers for admin user."""
     return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture
+def query_counter():
+    """Count SQL statements issued against the test engine.
+
+    Used by the N+1 regression tests: list endpoints should issue a
+    small constant number of queries regardless of row count.
+    """
+    from sqlalchemy import event
+
+    class QueryCounter:
+        def __init__(self):
+            self.count = 0
+
+        def reset(self):
+            self.count = 0
+
+    counter = QueryCounter()
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        counter.count += 1
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _count)
+    yield counter
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _count)
@@ -0,0 +1,113 @@
+"""
+N+1 regression tests for the list endpoints.
+
+Each test seeds enough rows that an accidental per-row lazy load would
+push the query count well past the asserted bound, then checks the
+endpoint stays within a small constant number of statements. Bounds use
+<= so a Redis cache hit (zero queries) also passes.
+"""
+from datetime import date
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.book import Book
+from app.models.review import Review
+from app.models.user import User
+
+
+async def _seed_books_with_reviews(
+        db_session: AsyncSession,
+        test_user: User,
+        test_admin: User,
+        num_books: int = 6
+) -> list:
+    """Create books each reviewed by both seeded users."""
+    books = [
+        Book(
+            title=f"Seed Book {i}",
+            author="Seed Author",
+            publisher="Seed Publisher",
+            publish_date=date(2024, 1, 15),
+            pages=100 + i,
+            language="English",
+            user_id=test_user.id
+        )
+        for i in range(num_books)
+    ]
+    db_session.add_all(books)
+    await db_session.commit()
+    for book in books:
+        await db_session.refresh(book)
+
+    reviews = []
+    for book in books:
+        for user in (test_user, test_admin):
+            reviews.append(Review(
+                content=f"Review of {book.title}",
+                rating=4,
+                user_id=user.id,
+                book_id=book.id
+            ))
+    db_session.add_all(reviews)
+    await db_session.commit()
+    return books
+
+
+class TestListEndpointQueryCounts:
+    """List endpoints must not regress to O(rows) queries."""
+
+    async def test_get_books_query_count_is_constant(
+            self, client: AsyncClient, db_session: AsyncSession,
+            test_user: User, test_admin: User, query_counter
+    ):
+        await _seed_books_with_reviews(db_session, test_user, test_admin)
+
+        query_counter.reset()
+        response = await client.get("/api/v1/books/")
+        assert response.status_code == 200
+        assert len(response.json()) >= 6
+        # One SELECT for books plus one batched selectin load of reviews
+        assert query_counter.count <= 3
+
+    async def test_get_all_reviews_query_count_is_constant(
+            self, client: AsyncClient, db_session: AsyncSession,
+            test_user: User, test_admin: User, query_counter
+    ):
+        await _seed_books_with_reviews(db_session, test_user, test_admin)
+
+        query_counter.reset()
+        response = await client.get("/api/v1/reviews/")
+        assert response.status_code == 200
+        assert len(response.json()) >= 12
+        # One streamed SELECT plus one selectin load each for reviewer
+        # and book per fetch batch
+        assert query_counter.count <= 4
+
+    async def test_get_reviews_by_book_query_count_is_constant(
+            self, client: AsyncClient, db_session: AsyncSession,
+            test_user: User, test_admin: User, query_counter
+    ):
+        books = await _seed_books_with_reviews(db_session, test_user, test_admin)
+
+        query_counter.reset()
+        response = await client.get(f"/api/v1/reviews/book/{books[0].uuid}")
+        assert response.status_code == 200
+        # Book lookup, reviews SELECT, plus the batched selectin loads
+        # the models declare (reviewer, book, their collections) — each
+        # is one query regardless of row count
+        assert query_counter.count <= 6
+
+    async def test_get_all_users_query_count_is_constant(
+            self, client: AsyncClient, db_session: AsyncSession,
+            test_user: User, test_admin: User, query_counter
+    ):
+        await _seed_books_with_reviews(db_session, test_user, test_admin)
+
+        query_counter.reset()
+        response = await client.get("/api/v1/users/")
+        assert response.status_code == 200
+        assert len(response.json()) >= 2
+        # One SELECT over users plus the batched selectin loads the
+        # User model declares (books, reviews, book reviews)
+        assert query_counter.count <= 4